@@ -3,9 +3,13 @@ from datetime import (
 )
 
 import logging
-import copy
+
+from types import (
+    MappingProxyType
+)
 
 import homeassistant.helpers.entity_registry as er
+import homeassistant.util.dt as dt_util
 
 from typing import (
     Dict, 
@@ -18,7 +22,13 @@ from typing import (
 )
 
 from asyncio import (
-    gather
+    TimeoutError,
+    gather,
+    Semaphore
+)
+
+from aiohttp import (
+    ClientError
 )
 
 from homeassistant.config_entries import (
@@ -31,10 +41,18 @@ from homeassistant.const import (
     CONF_NAME
 )
 
+from homeassistant.core import (
+    callback
+)
+
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed
 )
 
+from homeassistant.helpers.storage import (
+    Store
+)
+
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity, 
     DataUpdateCoordinator, 
@@ -49,18 +67,67 @@ from .schemas import (
 from .const import (
     DOMAIN,
     CONF_API_SECRET,
-    CONF_BALANCES,
-    CONF_EXCHANGES,
     CONF_MINING,
     CONF_DOMAIN,
-    CONF_NATIVE_CURRENCY,
-    MIN_TIME_BETWEEN_UPDATES,
-    MIN_TIME_BETWEEN_MINING_UPDATES,
+    CONF_MINING_CONCURRENCY,
+    CONF_MARKET_STREAM,
+    CONF_MARKET_STREAM_INTERVAL,
+    DEFAULT_MINING_CONCURRENCY,
+    CONF_USER_STREAM,
+    CONF_USER_STREAM_RECONCILE,
+    CONF_DEADBAND,
+    CONF_WORKER_TABLE,
+    DEFAULT_MARKET_STREAM_INTERVAL,
+    DEFAULT_USER_STREAM_RECONCILE,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    SNAPSHOT_SAVE_DELAY,
+    MARKET_STREAM_OFF,
+    WALLET_SOURCES,
+    MINING_SOURCES,
+    DEFAULT_INTERVALS,
+    SENSOR_SOURCES,
+    STALE_MAX_AGE,
+    CONF_INTERVALS,
+    CONF_RECV_WINDOW,
+    DEFAULT_RECV_WINDOW,
+    CONF_RETRY_ATTEMPTS,
+    CONF_RETRY_BACKOFF,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    TICKERS_FULL_UPDATE_INTERVAL,
+    TICKERS_SYMBOLS_LIMIT,
+    CONVERSION_BRIDGES,
+    SAVINGS_COINS,
     COORDINATOR_MINING,
     COORDINATOR_WALLET,
     FLOW_VERSION
 )
 
+from .models import (
+    BalanceRecord,
+    WorkerRecord,
+    WorkerTable
+)
+
+from .retry import (
+    RetryPolicy
+)
+
+from .discovery import (
+    get_sensor_descriptors,
+    require_sensor_data
+)
+
+from .session import (
+    async_get_connection_manager
+)
+
+from .streams import (
+    BinanceMarketStream,
+    BinanceUserStream
+)
+
 from .client import (
     BinancePoolClient, 
     BinanceAPIException, 
@@ -130,14 +197,37 @@ async def async_setup_entry(hass, config_entry: ConfigEntry) -> bool:
         
     _LOGGER.debug(f"[{name}] Setting up config entry")
 
-    binance_data_wallet = BinanceDataWallet(hass, config[CONF_API_KEY], config[CONF_API_SECRET], config[CONF_DOMAIN])
-    binance_data_mining = BinanceDataMining(hass, config[CONF_API_KEY], config[CONF_API_SECRET], config[CONF_DOMAIN], config.get(CONF_MINING))
+    connections = async_get_connection_manager(hass)
+    connections.acquire(entry_id)
+    await connections.async_load()
+    connection = connections.get(config[CONF_DOMAIN])
+
+    binance_data_wallet = BinanceDataWallet(hass, config[CONF_API_KEY], config[CONF_API_SECRET], config[CONF_DOMAIN], connection)
+    binance_data_mining = BinanceDataMining(hass, config[CONF_API_KEY], config[CONF_API_SECRET], config[CONF_DOMAIN], config.get(CONF_MINING), config.get(CONF_MINING_CONCURRENCY, DEFAULT_MINING_CONCURRENCY), connection)
+
+    binance_data_wallet.deadbands = binance_data_mining.deadbands = config.get(CONF_DEADBAND, {})
+    binance_data_mining.worker_table = config.get(CONF_WORKER_TABLE, False)
+    binance_data_wallet.set_intervals(config.get(CONF_INTERVALS, {}))
+    binance_data_mining.set_intervals(config.get(CONF_INTERVALS, {}))
+    binance_data_wallet.client.recv_window = binance_data_mining.client.recv_window = config.get(CONF_RECV_WINDOW, DEFAULT_RECV_WINDOW)
+    binance_data_wallet.client.retry_policy = binance_data_mining.client.retry_policy = RetryPolicy(config.get(CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS), config.get(CONF_RETRY_BACKOFF, DEFAULT_RETRY_BACKOFF))
 
-    upddata = [ binance_data_wallet.async_config_entry_first_refresh() ]
+    coordinators = { COORDINATOR_WALLET: binance_data_wallet }
     if config[CONF_MINING]:
-        upddata.append(
-            binance_data_mining.async_config_entry_first_refresh()
-        )
+        coordinators[COORDINATOR_MINING] = binance_data_mining
+        
+    snapshots = Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY.format(entry_id))
+    snapshot = await snapshots.async_load() or {}
+    
+    upddata = []
+    restored = []
+    
+    for key, coordinator in coordinators.items():
+        if coordinator.restore(snapshot.get(key)):
+            _LOGGER.debug(f"[{name}] Started {coordinator.name} from saved snapshot")
+            restored.append(coordinator)
+        else:
+            upddata.append(coordinator.async_config_entry_first_refresh())
     
     res = await gather(*upddata, return_exceptions=True)
     
@@ -146,132 +236,16 @@ async def async_setup_entry(hass, config_entry: ConfigEntry) -> bool:
             _LOGGER.debug('Exception: %s', str(r))
             await binance_data_wallet.client.close_connection()
             await binance_data_mining.client.close_connection()
+            await connections.async_release(entry_id)
             raise r
     
-    sensors = []
-    
-    if hasattr(binance_data_wallet, "balances"):
-        for balance in binance_data_wallet.balances:
-            if not config[CONF_BALANCES] or balance["coin"] in config[CONF_BALANCES]:
-                balance["name"] = name
-                balance["native"] = config[CONF_NATIVE_CURRENCY]
-                balance.pop("networkList", None)
-                
-                sensors.append(balance);
-
-                fundExists = False
-                
-                for funding in binance_data_wallet.funding:
-                    if funding["asset"] == balance["coin"]:
-                        fundExists = True
-                        
-                        funding["name"] = name
-                        funding["native"] = config[CONF_NATIVE_CURRENCY]                
-                        funding.pop("btcValuation", None)
-                        
-                        sensors.append(funding)
-                        
-                        break
-
-                if not fundExists:
-                    funding = {
-                        "name": name,
-                        "native": config[CONF_NATIVE_CURRENCY],
-                        "asset": balance["coin"],
-                        "free": "0",
-                        "locked": "0",
-                        "freeze": "0",
-                        "withdrawing": "0",
-                    }
-                    
-                    sensors.append(funding)
-                    
-        for coin in [ 'BTC', 'USDT']:
-            sensors.append({
-                'name': name,
-                'native': config[CONF_NATIVE_CURRENCY],
-                'coin': coin,
-                'total': binance_data_wallet.savings[f'totalAmountIn{coin}'],
-                'fixed': binance_data_wallet.savings[f'totalLockedIn{coin}'],
-                'flexible': binance_data_wallet.savings[f'totalFlexibleAmountIn{coin}']
-            })
-
-    if hasattr(binance_data_wallet, "tickers"):
-        for ticker in binance_data_wallet.tickers:
-            if not config[CONF_EXCHANGES] or ticker["symbol"] in config[CONF_EXCHANGES]:
-                ticker["name"] = name
-                
-                sensors.append(ticker)       
-
-    if hasattr(binance_data_mining, "mining"):
-        for account, algos in binance_data_mining.mining.items():
-            if not config[CONF_MINING] or account in config[CONF_MINING]:
-                for algo, typ in algos.items():
-                    unknown = invalid = inactive = 0
-                    
-                    if "workers" in typ:
-                        for worker in typ["workers"]:
-                            worker["name"] = name
-                            worker["algorithm"] = algo
-                            worker["account"] = account
-                            
-                            sensors.append(worker)
-                            
-                            if worker["status"] == 0:
-                                unknown += 1
-                            elif worker["status"] == 2:
-                                invalid += 1
-                            elif worker["status"] == 3:
-                                inactive += 1    
-                            
-                    if "status" in typ:
-                        status = copy.deepcopy(typ["status"])
-                        status["name"] = name
-                        status["algorithm"] = algo
-                        status["account"] = account
-                        status["unknown"] = unknown
-                        status["invalid"] = invalid
-                        status["inactive"] = inactive
-                        
-                        if "fifteenMinHashRate" not in status:
-                            status["fifteenMinHashRate"] = 0
-                            
-                        if "dayHashRate" not in status:
-                            status["dayHashRate"] = 0                    
-    
-                        for coindata in binance_data_mining.coins:
-                            if coindata["algoName"].lower() != algo:
-                                continue
+    sensors = get_sensor_descriptors(name, config, binance_data_wallet, binance_data_mining)
+    require_sensor_data(binance_data_wallet, sensors)
     
-                            coin = coindata["coinName"]
-                            
-                            estimate = status.get("profitToday", {})
-                            earnings = status.get("profitYesterday", {})
-                            
-                            profit = {
-                                "name": name, 
-                                "algorithm": algo,
-                                "account": account,
-                                "coin": coin,
-                                "native": config[CONF_NATIVE_CURRENCY]
-                            }
-                            
-                            if coin in estimate:
-                                profit["profitToday"] = estimate[coin]
-                            else:
-                                profit["profitToday"] = 0
-                            
-                            if coin in earnings:
-                                profit["profitYesterday"] = earnings[coin]
-                            else:
-                                profit["profitYesterday"] = 0
-                              
-                            sensors.append(profit)
-                        
-                        status.pop("profitToday", None)
-                        status.pop("profitYesterday", None)
+    binance_data_wallet.update_rates()
     
-                        sensors.append(status)
+    if binance_data_wallet not in restored:
+        await binance_data_wallet.async_update_symbols()
                         
     hass.data.setdefault(DOMAIN, {})[entry_id] = {
         'config': config,
@@ -283,11 +257,50 @@ async def async_setup_entry(hass, config_entry: ConfigEntry) -> bool:
     }
     
     config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
+    
+    save_pending = False
+    
+    @callback
+    def dump_snapshot():
+        nonlocal save_pending
+        save_pending = False
+        
+        return { key: coordinator.dump() for key, coordinator in coordinators.items() }
+    
+    @callback
+    def async_save_snapshot():
+        """Save at most once per SNAPSHOT_SAVE_DELAY, later updates do not postpone a pending save"""
+        nonlocal save_pending
+        
+        if save_pending or not all(coordinator.last_update_success for coordinator in coordinators.values()):
+            return
+        
+        save_pending = True
+        snapshots.async_delay_save(dump_snapshot, SNAPSHOT_SAVE_DELAY)
+            
+    for coordinator in coordinators.values():
+        config_entry.async_on_unload(coordinator.async_add_listener(async_save_snapshot))
+    
+    if config.get(CONF_MARKET_STREAM, MARKET_STREAM_OFF) != MARKET_STREAM_OFF:
+        binance_data_wallet.stream = BinanceMarketStream(hass, binance_data_wallet, config[CONF_MARKET_STREAM], config.get(CONF_MARKET_STREAM_INTERVAL, DEFAULT_MARKET_STREAM_INTERVAL))
+        binance_data_wallet.stream.async_start()
+        
+        config_entry.async_on_unload(binance_data_wallet.stream.async_stop)
+        
+    if config.get(CONF_USER_STREAM):
+        binance_data_wallet.reconcile_interval = timedelta(minutes=config.get(CONF_USER_STREAM_RECONCILE, DEFAULT_USER_STREAM_RECONCILE))
+        binance_data_wallet.user_stream = BinanceUserStream(hass, binance_data_wallet)
+        binance_data_wallet.user_stream.async_start()
+        
+        config_entry.async_on_unload(binance_data_wallet.user_stream.async_stop)
                         
     if sensors:
         hass.async_create_task(
             hass.config_entries.async_forward_entry_setups(config_entry, "sensor")
         )
+        
+    for coordinator in restored:
+        hass.async_create_task(coordinator.async_refresh())
 
     return True
    
@@ -309,9 +322,14 @@ async def async_unload_entry(hass, config_entry: ConfigEntry) -> None:
                 ent_reg.async_remove(entity.entity_id)
     
         hass.data[DOMAIN].pop(config_entry.entry_id)
+        
+        await async_get_connection_manager(hass).async_release(config_entry.entry_id)
 
     return onload_ok   
 
+async def async_remove_entry(hass, config_entry: ConfigEntry) -> None:
+    await Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY.format(config_entry.entry_id)).async_remove()
+
 async def async_reload_entry(hass, config_entry: ConfigEntry) -> None:
     _LOGGER.info(f"[{config_entry.data[CONF_NAME]}] Reloading configuration entry")
     await hass.config_entries.async_reload(config_entry.entry_id)   
@@ -335,20 +353,310 @@ def find_existing_entry(hass, name) -> Optional[ConfigEntry]:
             return config_entry   
   
       
-class BinanceDataMining(DataUpdateCoordinator):
-    def __init__(self, hass, api_key, api_secret, tld, miners = []):
+class BinanceCoordinator(DataUpdateCoordinator):
+    """Coordinator waking only the entities whose data changed
+    
+        Subclasses describe their data as a snapshot of entity context -> comparable 
+        values. Listeners are called only for contexts that differ from the previous 
+        snapshot. Listeners without context, and all listeners after a failed update, 
+        are always called.
+    """
+    
+    def __init__(self, *args, sources = (), **kwargs):
         """Initialize."""
+        self.intervals = { source: timedelta(seconds=DEFAULT_INTERVALS[source]) for source in sources }
+        self.due = {}
+        self.updated = {}
+        self.failures = {}
+        
+        super().__init__(*args, update_interval=min(self.intervals.values()), **kwargs)
+        
+        self.changed = None
+        self.generation = 0
+        self.deadbands = {}
+        self.write_stats = {}
+        self._snapshot = {}
+        self._health = {}
+        self._notified_success = True
+        
+    def _get_snapshot(self):
+        return {}
+        
+    def _update_indexes(self):
+        pass
+    
+    def set_intervals(self, intervals):
+        """Refresh each data source every `intervals[source]` seconds, waking at the shortest one"""
+        
+        for source, seconds in intervals.items():
+            if source in self.intervals:
+                self.intervals[source] = timedelta(seconds=seconds)
+                
+        self.update_interval = min(self.intervals.values())
+        
+    def _get_due_sources(self, now) -> set:
+        """Sources due before the middle of the next update interval"""
         
-        super().__init__(hass, _LOGGER, name="BinanceDataMining", update_interval=timedelta(minutes=MIN_TIME_BETWEEN_MINING_UPDATES))
-        self.client = BinancePoolClient(api_key, api_secret, tld=tld)
+        limit = now + self.update_interval / 2
+        
+        return { source for source in self.intervals if source not in self.due or self.due[source] <= limit }
+    
+    def _set_results(self, due, failed, now):
+        """Keep last good data of failed sources, schedule the others
+        
+            Failed sources are retried after the time they have been failing, at least 
+            one update interval and at most their own interval, so the delay doubles.
+        """
+        
+        for source in due:
+            if source in failed:
+                since = self.failures.setdefault(source, now)
+                self.due[source] = now + min(self.intervals[source], max(self.update_interval, now - since))
+            else:
+                self.failures.pop(source, None)
+                self.updated[source] = now
+                self.due[source] = now + self.intervals[source]
+                
+    def is_expired(self, source) -> bool:
+        """Whether last good data of the source is missing or older than its maximum age"""
+        
+        if source not in self.intervals:
+            return False
+        
+        updated = self.updated.get(source)
+        max_age = max(timedelta(seconds=STALE_MAX_AGE), self.intervals[source] * 2)
+        
+        return updated is None or dt_util.utcnow() - updated > max_age
+    
+    def _raise_if_expired(self):
+        if all(self.is_expired(source) for source in self.intervals):
+            raise UpdateFailed(f"No data of {self.name} from binance.{self.tld} is recent enough")
+        
+    def _dump(self):
+        return None
+        
+    def dump(self):
+        """Compact JSON-serializable copy of the current data, None if there is nothing to keep"""
+        
+        data = self._dump()
+        if data:
+            data["updated"] = { source: updated.isoformat() for source, updated in self.updated.items() }
+            
+        return data
+        
+    def _restore(self, data):
+        raise Exception('Unimplemented')
+        
+    def restore(self, data) -> bool:
+        """Publish data saved by `dump` as if it was just fetched, False if there is none"""
+        
+        if not data:
+            return False
+        
+        try:
+            self._restore(data)
+            
+            for source, updated in data.get("updated", {}).items():
+                updated = dt_util.parse_datetime(updated)
+                
+                if source in self.intervals and updated:
+                    self.updated[source] = updated
+            
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.debug(f"Snapshot of {self.name} not restored: {e}")
+            return False
+        
+        self._update_indexes()
+        self._diff()
+        self.data = True
+        
+        return True
+        
+    def _diff(self):
+        snapshot = self._get_snapshot()
+        previous = self._snapshot
+        
+        changed = { context for context, value in snapshot.items() if previous.get(context) != value }
+        changed.update(context for context in previous if context not in snapshot)
+        
+        if snapshot.keys() != previous.keys():
+            self.generation += 1
+            
+        health = { source: (source in self.failures, self.is_expired(source)) for source in self.intervals }
+        flipped = { source for source, value in health.items() if self._health.get(source) != value }
+        
+        if flipped:
+            changed.update(context for context in snapshot if SENSOR_SOURCES.get(context[0]) in flipped)
+            
+        self._health = health
+        self._snapshot = snapshot
+        self.changed = changed if self.changed is None else self.changed | changed
+        
+    @callback
+    def async_update_listeners(self):
+        changed, self.changed = self.changed, None
+        
+        if changed is None or not self.last_update_success or not self._notified_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+
+class BinanceDataMining(BinanceCoordinator):
+    def __init__(self, hass, api_key, api_secret, tld, miners = [], concurrency = DEFAULT_MINING_CONCURRENCY, connection = None):
+        """Initialize."""
+        
+        super().__init__(hass, _LOGGER, name="BinanceDataMining", sources=MINING_SOURCES)
+        self.client = BinancePoolClient(api_key, api_secret, connection=connection, tld=tld)
         
         self.mining = {}
         self.coins = {}
+        self.algos = []
         self.tld = tld
+        self.concurrency = concurrency
+        self.worker_table = False
+        
+        self.workers = MappingProxyType({})
+        self.statuses = MappingProxyType({})
+        self.worker_counts = MappingProxyType({})
+        self.algo_coins = MappingProxyType({})
+        self.tables = MappingProxyType({})
         
         for account in miners:
             self.mining[account] = {}
 
+    def _update_indexes(self):
+        """Publish read-only indexes of the refresh for sensors
+        
+            workers: (account, algo, worker) -> worker record
+            statuses: (account, algo) -> status record
+            worker_counts: (account, algo) -> (unknown, invalid, inactive)
+            algo_coins: algo -> coin names
+            tables: (account, algo) -> WorkerTable, only in worker_table mode
+        """
+        
+        workers = {}
+        statuses = {}
+        worker_counts = {}
+        tables = {}
+        
+        for account, algos in self.mining.items():
+            for algo, typ in algos.items():
+                if "workers" in typ:
+                    unknown = invalid = inactive = 0
+                    
+                    for worker in typ["workers"]:
+                        workers[(account, algo, worker.name)] = worker
+                        
+                        if worker.status == 0:
+                            unknown += 1
+                        elif worker.status == 2:
+                            invalid += 1
+                        elif worker.status == 3:
+                            inactive += 1
+                            
+                    worker_counts[(account, algo)] = (unknown, invalid, inactive)
+                    
+                    if self.worker_table:
+                        tables[(account, algo)] = WorkerTable(typ["workers"])
+                    
+                if "status" in typ:
+                    statuses[(account, algo)] = typ["status"]
+                    
+        algo_coins = {}
+        for coindata in self.coins:
+            algo_coins.setdefault(coindata["algoName"].lower(), []).append(coindata["coinName"])
+            
+        self.workers = MappingProxyType(workers)
+        self.statuses = MappingProxyType(statuses)
+        self.worker_counts = MappingProxyType(worker_counts)
+        self.tables = MappingProxyType(tables)
+        self.algo_coins = MappingProxyType({ algo: tuple(coins) for algo, coins in algo_coins.items() })
+
+    def _dump(self):
+        if not self.workers and not self.statuses:
+            return None
+        
+        mining = {}
+        for account, algos in self.mining.items():
+            mining[account] = {}
+            
+            for algo, typ in algos.items():
+                data = mining[account][algo] = {}
+                
+                if "workers" in typ:
+                    data["workers"] = [ (worker.name, *worker.values()) for worker in typ["workers"] ]
+                    
+                if "status" in typ:
+                    data["status"] = typ["status"]
+                    
+        return {
+            "coins": [ (coindata["coinName"], coindata["algoName"]) for coindata in self.coins ],
+            "mining": mining
+        }
+        
+    def _restore(self, data):
+        self.coins = [ { "coinName": coin, "algoName": algo } for coin, algo in data["coins"] ]
+        
+        for account, algos in data["mining"].items():
+            if account not in self.mining:
+                continue
+            
+            for algo, typ in algos.items():
+                restored = self.mining[account][algo] = {}
+                
+                if "workers" in typ:
+                    restored["workers"] = [ WorkerRecord(*worker) for worker in typ["workers"] ]
+                    
+                if "status" in typ:
+                    restored["status"] = typ["status"]
+
+    def _get_snapshot(self):
+        snapshot = {}
+        
+        for (account, algo, name), worker in self.workers.items():
+            snapshot[("worker", account, algo, name)] = worker.values()
+            
+        for (account, algo), table in self.tables.items():
+            snapshot[("worker_table", account, algo)] = table.fingerprint()
+            
+        for (account, algo), status in self.statuses.items():
+            snapshot[("status", account, algo)] = (status.get("fifteenMinHashRate"), status.get("dayHashRate"), status.get("validNum"), status.get("invalidNum"), self.worker_counts.get((account, algo)))
+            
+            estimate = status.get("profitToday", {})
+            earnings = status.get("profitYesterday", {})
+            
+            for coin in self.algo_coins.get(algo, ()):
+                snapshot[("profit", account, algo, coin)] = (estimate.get(coin), earnings.get(coin))
+                
+        return snapshot
+
+    async def _async_update_algo(self, semaphore, account, algoname, workers = True, status = True):
+        """Fetch workers and/or status of one (account, algo) pair"""
+        
+        async with semaphore:
+            if workers:
+                workers_list = []
+                
+                async for page in self.client.async_iter_mining_workers(algo=algoname, userName=account):
+                    workers_list.extend(WorkerRecord.from_dict(worker) for worker in page)
+                    
+                if workers_list:
+                    self.mining[account][algoname].update({ "workers": workers_list })
+                    _LOGGER.debug(f"Mining workers updated for {account} ({algoname}) from binance.{self.tld}")
+
+            if not status:
+                return
+            
+            status_info = await self.client.async_get_mining_status(algo=algoname, userName=account)
+            if status_info:
+                self.mining[account][algoname].update({ "status": status_info })
+                _LOGGER.debug(f"Mining status updated for {account} ({algoname}) from binance.{self.tld}")
+
     async def _async_update_data(self):
         _LOGGER.debug(f"Fetching mining data from binance.{self.tld}")
 
@@ -359,43 +667,63 @@ class BinanceDataMining(DataUpdateCoordinator):
                     _LOGGER.debug("Recreate API session")
                     self.client.session = self.client._init_session()
                     
-                common_queries = [
-                    self.client.async_get_mining_coinlist(),
-                    self.client.async_get_mining_algolist()
-                ] 
+                now = dt_util.utcnow()
+                due = self._get_due_sources(now)
+                failed = set()
                 
-                res = await gather(*common_queries, return_exceptions=True)
-                for r in res:
-                    if isinstance(r, Exception): 
-                        _LOGGER.debug('Catched Exception: %s', str(r))
+                if "lists" in due or not self.coins or not self.algos:
+                    due.add("lists")
+                    
+                    common_queries = [
+                        self.client.async_get_mining_coinlist(),
+                        self.client.async_get_mining_algolist()
+                    ] 
+                    
+                    coins, algos = await gather(*common_queries, return_exceptions=True)
+                    
+                    if isinstance(coins, Exception) or isinstance(algos, Exception):
+                        _LOGGER.warning(f"Mining lists not updated from binance.{self.tld}: {coins if isinstance(coins, Exception) else algos}")
+                        failed.add("lists")
                         
-                        await self.client.close_connection()
-                        raise r
-                                                        
-                coins, algos = res
-                
-                if coins:
-                    self.coins = coins
-
-                    if algos:
-                        for algo in algos:
-                            algoname = algo["algoName"].lower()
+                    else:
+                        if coins:
+                            self.coins = coins
                             
-                            for account, algorithm in self.mining.items():
-                                if algoname not in algorithm:
-                                    self.mining[account][algoname] = {}
+                        if algos:
+                            self.algos = algos
+                
+                if not self.coins or not self.algos:
+                    failed.update(due & { "workers", "status" })
+                    
+                elif due & { "workers", "status" }:
+                    semaphore = Semaphore(self.concurrency)
+                    pairs = []
+                    
+                    for algo in self.algos:
+                        algoname = algo["algoName"].lower()
+                        
+                        for account, algorithm in self.mining.items():
+                            if algoname not in algorithm:
+                                self.mining[account][algoname] = {}
                                 
-                                miner_list = await self.client.async_get_mining_worker_list(algo=algoname, userName=account)
-                                if miner_list:
-                                    workers_list = miner_list.get("workerDatas", [])
-                                    if workers_list:
-                                        self.mining[account][algoname].update({ "workers": workers_list })
-                                        _LOGGER.debug(f"Mining workers updated for {account} ({algoname}) from binance.{self.tld}")
-        
-                                    status_info = await self.client.async_get_mining_status(algo=algoname, userName=account)
-                                    if status_info:
-                                        self.mining[account][algoname].update({ "status": status_info })
-                                        _LOGGER.debug(f"Mining status updated for {account} ({algoname}) from binance.{self.tld}")                               
+                            pairs.append((account, algoname))
+                            
+                    res = await gather(*[ self._async_update_algo(semaphore, account, algoname, "workers" in due, "status" in due) for account, algoname in pairs ], return_exceptions=True)
+                    
+                    failed_pairs = 0
+                    for (account, algoname), r in zip(pairs, res):
+                        if isinstance(r, Exception):
+                            failed_pairs += 1
+                            _LOGGER.warning(f"Mining data for {account} ({algoname}) not updated from binance.{self.tld}: {r}")
+                            
+                    if pairs and failed_pairs == len(pairs):
+                        _LOGGER.warning(f"All mining requests to binance.{self.tld} failed")
+                        failed.update(due & { "workers", "status" })
+                    
+                self._set_results(due, failed, now)
+                self._update_indexes()
+                self._diff()
+                self._raise_if_expired()
                     
             return True
 
@@ -403,19 +731,279 @@ class BinanceDataMining(DataUpdateCoordinator):
             raise UpdateFailed from e
 
             
-class BinanceDataWallet(DataUpdateCoordinator):
+class BinanceDataWallet(BinanceCoordinator):
     
-    def __init__(self, hass, api_key, api_secret, tld):
+    def __init__(self, hass, api_key, api_secret, tld, connection = None):
         """Initialize."""
-        super().__init__(hass, _LOGGER, name="BinanceDataWallet", update_interval=timedelta(minutes=MIN_TIME_BETWEEN_UPDATES))
+        super().__init__(hass, _LOGGER, name="BinanceDataWallet", sources=WALLET_SOURCES)
         
-        self.client = BinancePoolClient(api_key, api_secret, tld=tld)
+        self.client = BinancePoolClient(api_key, api_secret, connection=connection, tld=tld)
         self.hass = hass
         self.balances = []
         self.funding = []
         self.savings = {}
-        self.tickers = {}
         self.tld = tld
+        self.stream = None
+        self.user_stream = None
+        self.reconcile_interval = timedelta(minutes=DEFAULT_USER_STREAM_RECONCILE)
+        self.balances_updated = None
+        
+        self.markets = set()
+        self.markets_updated = None
+        self.symbols_required = set()
+        self.conversions_required = set()
+        
+        self.balances_by_coin = MappingProxyType({})
+        self.funding_by_asset = MappingProxyType({})
+        
+        self.prices = {}
+        self.rates = {}
+        self.routes = {}
+        self.symbols = {}
+        
+    def require_symbol(self, symbol):
+        """Request price of an exchange pair on next updates"""
+        self.symbols_required.add(symbol.upper())
+        
+    def require_conversion(self, coin, natives):
+        """Request prices for conversion of the coin to native currencies on next updates"""
+        for native in natives:
+            if native.upper() != coin.upper():
+                self.conversions_required.add((coin.upper(), native.upper()))
+                
+    def _markets_expired(self):
+        return not self.markets or dt_util.utcnow() - self.markets_updated > timedelta(minutes=TICKERS_FULL_UPDATE_INTERVAL)
+                
+    def get_ticker_symbols(self):
+        """Minimal set of symbols for sensors, None if the full ticker list is needed"""
+        
+        if self._markets_expired() or not (self.symbols_required or self.conversions_required):
+            return None
+        
+        symbols = { symbol for symbol in self.symbols_required if symbol in self.markets }
+        
+        for coin, native in self.conversions_required:
+            route = self._find_route(coin, native, self.markets)
+            if route:
+                symbols.update(symbol for symbol, inverse in route)
+                
+        if not symbols or len(symbols) > TICKERS_SYMBOLS_LIMIT:
+            return None
+        
+        return sorted(symbols)
+        
+    async def _async_get_tickers(self):
+        if self.stream and self.stream.connected and self.prices and not self._markets_expired():
+            return None
+        
+        symbols = self.get_ticker_symbols()
+        
+        if symbols:
+            try:
+                return await self.client.async_get_symbol_tickers(symbols)
+            
+            except BinanceAPIException as e:
+                _LOGGER.debug(f"Fall back to full ticker list from binance.{self.tld}: {e}")
+            
+        prices = await self.client.get_all_tickers()
+        
+        if prices:
+            self.markets = { ticker["symbol"] for ticker in prices }
+            self.markets_updated = dt_util.utcnow()
+            
+        return prices
+    
+    def _update_indexes(self):
+        """Publish read-only coin -> balance and asset -> funding indexes for sensors"""
+        
+        self.balances_by_coin = MappingProxyType({ balance.coin: balance for balance in self.balances })
+        self.funding_by_asset = MappingProxyType({ funding.coin: funding for funding in self.funding })
+        
+    def _dump(self):
+        if not self.balances and not self.prices:
+            return None
+        
+        return {
+            "balances": [ (balance.coin, *balance.values()) for balance in self.balances ],
+            "funding": [ (funding.coin, *funding.values()) for funding in self.funding ],
+            "savings": self.savings,
+            "prices": self.prices,
+            "symbols": self.symbols
+        }
+        
+    def _restore(self, data):
+        self.balances = [ BalanceRecord(*balance) for balance in data["balances"] ]
+        self.funding = [ BalanceRecord(*funding) for funding in data["funding"] ]
+        self.savings = data["savings"]
+        self.prices = { symbol: float(price) for symbol, price in data["prices"].items() }
+        self.symbols = { symbol: tuple(pair) for symbol, pair in data["symbols"].items() }
+        
+    def _get_snapshot(self):
+        """Raw values of every wallet sensor context, with the conversion rates of its coin"""
+        
+        rates = {}
+        for (coin, native), (rate, decimals) in self.rates.items():
+            rates.setdefault(coin, []).append((native, rate))
+            
+        rates = { coin: tuple(sorted(pairs)) for coin, pairs in rates.items() }
+        snapshot = {}
+        
+        for coin, balance in self.balances_by_coin.items():
+            snapshot[("balance", coin)] = (balance.values(), rates.get(coin))
+            
+        for asset, funding in self.funding_by_asset.items():
+            snapshot[("funding", asset)] = (funding.values(), rates.get(asset))
+            
+        for coin in rates:
+            snapshot.setdefault(("funding", coin), (rates[coin],))
+            
+        for coin in SAVINGS_COINS:
+            snapshot[("savings", coin)] = (tuple(value for key, value in self.savings.items() if key.endswith(f"In{coin}")), rates.get(coin))
+            
+        for symbol, price in self.prices.items():
+            snapshot[("exchange", symbol)] = (price, self.symbols.get(symbol))
+            
+        return snapshot
+        
+    async def _async_get_balances(self):
+        if self.user_stream and self.user_stream.connected and self.balances_updated and dt_util.utcnow() - self.balances_updated < self.reconcile_interval:
+            return self.balances
+        
+        balances = await self.client.async_get_capital_balances()
+        
+        if balances:
+            balances = [ BalanceRecord.from_dict(balance) for balance in balances ]
+            self.balances_updated = dt_util.utcnow()
+            _LOGGER.debug(f"Balances reconciled from binance.{self.tld}")
+            
+        return balances
+    
+    @callback
+    def async_apply_balance_event(self, event):
+        """Apply outboundAccountPosition event of the user data stream
+        
+            Deltas of balanceUpdate events are not applied, every balance change is also 
+            sent as absolute values in outboundAccountPosition.
+        """
+        
+        index = self.balances_by_coin
+        
+        for position in event.get("B", []):
+            balance = index.get(position["a"])
+            
+            if balance is None:
+                balance = BalanceRecord(position["a"])
+                self.balances.append(balance)
+                
+            balance.free = float(position["f"])
+            balance.locked = float(position["l"])
+            
+        self._update_indexes()
+        self._diff()
+            
+        self.async_update_listeners()
+        
+    async def async_update_symbols(self):
+        """Split required exchange pairs to (base, quote) from exchangeInfo, guess by balances if unavailable"""
+        
+        missing = [ symbol for symbol in self.symbols_required if symbol not in self.symbols and symbol in self.markets ]
+        if not missing:
+            return
+        
+        symbols = dict(self.symbols)
+        
+        try:
+            symbols.update(await self.client.async_get_exchange_symbols(missing))
+                
+        except (BinanceAPIException, BinanceRequestException, ClientError, TimeoutError) as e:
+            _LOGGER.debug(f"Exchange info not received from binance.{self.tld}: {e}")
+            
+            coins = { balance.coin for balance in self.balances }
+            
+            for symbol in missing:
+                for coin in coins:
+                    if symbol.endswith(coin) and symbol[:-len(coin)] in coins:
+                        symbols[symbol] = (symbol[:-len(coin)], coin)
+                        break
+                    
+        self.symbols = symbols
+        
+    @staticmethod
+    def _find_leg(base, quote, symbols):
+        if base + quote in symbols:
+            return (base + quote, False)
+        
+        if quote + base in symbols:
+            return (quote + base, True)
+        
+        return None
+    
+    def _find_route(self, coin, native, symbols):
+        """Legs (symbol, inverse) converting the coin to native, directly or through one of CONVERSION_BRIDGES"""
+        
+        leg = self._find_leg(coin, native, symbols)
+        if leg:
+            return (leg,)
+        
+        for bridge in CONVERSION_BRIDGES:
+            if bridge in (coin, native):
+                continue
+            
+            first = self._find_leg(coin, bridge, symbols)
+            if not first:
+                continue
+            
+            second = self._find_leg(bridge, native, symbols)
+            if second:
+                return (first, second)
+            
+        return None
+    
+    def update_rates(self):
+        """Rebuild (rate, decimals) for each required (coin, native) pair from the prices by symbol
+        
+            Decimals are 2 when the coin is the base asset of every leg and 8 otherwise.
+        """
+        
+        rates = {}
+        for pair in self.conversions_required:
+            route = self.routes.get(pair)
+            
+            if not route or any(symbol not in self.prices for symbol, inverse in route):
+                route = self.routes[pair] = self._find_route(*pair, self.prices)
+                
+            if not route:
+                continue
+            
+            rate = 1.0
+            for symbol, inverse in route:
+                price = self.prices[symbol]
+                
+                if inverse:
+                    rate = rate / price if price else 0.0
+                else:
+                    rate = rate * price
+                    
+            rates[pair] = (rate, 8 if any(inverse for symbol, inverse in route) else 2)
+            
+        self.rates = rates
+        
+    @callback
+    def async_set_prices(self, prices):
+        """Apply prices pushed by the market stream for known or required symbols and notify sensors"""
+        
+        wanted = set(self.get_ticker_symbols() or ())
+        
+        updated = False
+        for symbol, price in prices.items():
+            if symbol in self.prices or symbol in wanted:
+                self.prices[symbol] = float(price)
+                updated = True
+                
+        if updated:
+            self.update_rates()
+            self._diff()
+            self.async_update_listeners()
         
     async def _async_update_data(self):
         _LOGGER.debug(f"Fetching wallet data from binance.{self.tld}")
@@ -425,38 +1013,52 @@ class BinanceDataWallet(DataUpdateCoordinator):
                 _LOGGER.debug("Recreate API session")
                 self.client.session = self.client._init_session()
 
-            tasks = [
-                self.client.async_get_capital_balances(),
-                self.client.async_get_funding_balances(),
-                self.client.async_get_simple_earn_account(),
-                self.client.get_all_tickers()
-            ]
+            now = dt_util.utcnow()
+            due = self._get_due_sources(now)
+            
+            sources = {
+                "balances": self._async_get_balances,
+                "funding": self.client.async_get_funding_balances,
+                "savings": self.client.async_get_simple_earn_account,
+                "prices": self._async_get_tickers
+            }
+            tasks = { source: fetch() for source, fetch in sources.items() if source in due }
+            
+            res = dict(zip(tasks, await gather(*tasks.values(), return_exceptions=True)))
+            failed = set()
             
-            res = await gather(*tasks, return_exceptions=True)
-            for r in res:
+            for source, r in res.items():
                 if isinstance(r, Exception):
-                    _LOGGER.debug('Catched Exception: %s', str(r))
-                    await self.client.close_connection()
-                    raise r
+                    _LOGGER.warning(f"Wallet {source} not updated from binance.{self.tld}: {r}")
+                    failed.add(source)
                 
-            balances, funding, savings, prices = res
+            balances, funding, savings, prices = (None if source in failed else res.get(source) for source in sources)
             
             if balances:
                 self.balances = balances
                 _LOGGER.debug(f"Balances updated from binance.{self.tld}")
 
             if funding:
-                self.funding = funding
+                self.funding = [ BalanceRecord.from_dict(asset, "asset") for asset in funding ]
                 _LOGGER.debug(f"Funding data updated from binance.{self.tld}")
 
 
             if savings:
                 self.savings = savings
                 _LOGGER.debug(f"Savings data updated from binance.{self.tld}")
+                
+            self._update_indexes()
 
             if prices:
-                self.tickers = prices
+                self.prices = { ticker["symbol"]: float(ticker["price"]) for ticker in prices }
+                self.update_rates()
                 _LOGGER.debug(f"Exchange rates updated from binance.{self.tld}")
+                
+            await self.async_update_symbols()
+            
+            self._set_results(due, failed, now)
+            self._diff()
+            self._raise_if_expired()
 
             return True
         
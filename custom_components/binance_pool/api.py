@@ -0,0 +1,175 @@
+"""
+Minimal Binance REST client: request signing, answers and errors
+
+Only the parts of python-binance used by the integration, so the library is
+not imported at all.
+"""
+
+import hashlib
+import hmac
+import json
+import time
+
+
+class BinanceAPIException(Exception):
+    """Error answer of Binance API, `code` and `message` are taken from its JSON body"""
+
+    def __init__(self, response, status_code, text):
+        """Initialize."""
+        self.code = 0
+
+        try:
+            answer = json.loads(text)
+
+        except ValueError:
+            self.message = f'Invalid JSON error message from Binance: {text}'
+
+        else:
+            self.code = answer.get('code', 0) if isinstance(answer, dict) else 0
+            self.message = answer.get('msg') if isinstance(answer, dict) else text
+
+        self.status_code = status_code
+        self.response = response
+
+    def __str__(self):
+        return f'APIError(code={self.code}): {self.message}'
+
+
+class BinanceRequestException(Exception):
+    """Answer of Binance API that could not be used"""
+
+    def __init__(self, message):
+        """Initialize."""
+        self.message = message
+
+    def __str__(self):
+        return f'BinanceRequestException: {self.message}'
+
+
+class BinanceAsyncClient:
+    """HMAC-SHA256 signed requests to /api and /sapi of binance.{tld}
+
+        Subclasses provide `_request(method, uri, signed, force_params, **kwargs)`
+        and the session it sends through.
+    """
+
+    API_URL = 'https://api.binance.{}/api'
+    MARGIN_API_URL = 'https://api.binance.{}/sapi'
+    PUBLIC_API_VERSION = 'v1'
+    PRIVATE_API_VERSION = 'v3'
+    MARGIN_API_VERSION = 'v1'
+    REQUEST_TIMEOUT = 10
+
+    def __init__(self, api_key=None, api_secret=None, tld='com'):
+        """Initialize."""
+        self.API_KEY = api_key
+        self.API_SECRET = api_secret
+        self.tld = tld
+        self.session = None
+        self.response = None
+
+    @property
+    def timestamp_offset(self) -> int:
+        """Server time minus local time in ms"""
+        return 0
+
+    def _get_headers(self) -> dict:
+        headers = { 'Accept': 'application/json' }
+
+        if self.API_KEY:
+            headers['X-MBX-APIKEY'] = self.API_KEY
+
+        return headers
+
+    def _generate_signature(self, query: str) -> str:
+        return hmac.new(self.API_SECRET.encode('utf-8'), query.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def _get_request_kwargs(self, method, signed: bool, force_params: bool = False, **kwargs):
+        """Parameters go to the query string in key order, with the signature of that string last
+
+            Values are sent as given, callers quote the ones that need it.
+        """
+        kwargs['timeout'] = kwargs.get('timeout', self.REQUEST_TIMEOUT)
+
+        data = { key: value for key, value in (kwargs.pop('data', None) or {}).items() if value is not None }
+
+        if signed:
+            data['timestamp'] = int(time.time() * 1000 + self.timestamp_offset)
+
+        query = '&'.join(f"{key}={value}" for key, value in sorted(data.items()))
+
+        if signed:
+            query = f"{query}&signature={self._generate_signature(query)}"
+
+        if query:
+            kwargs['params'] = query
+
+        return kwargs
+
+    async def _handle_response(self, response):
+        text = await response.text()
+
+        if not 200 <= response.status < 300:
+            raise BinanceAPIException(response, response.status, text)
+
+        try:
+            return json.loads(text)
+
+        except ValueError:
+            raise BinanceRequestException(f'Invalid Response: {text}')
+
+    def _create_api_uri(self, path: str, version: str = PRIVATE_API_VERSION) -> str:
+        return self.API_URL.format(self.tld) + '/' + version + '/' + path
+
+    def _create_margin_api_uri(self, path: str, version: str = MARGIN_API_VERSION) -> str:
+        return self.MARGIN_API_URL.format(self.tld) + '/' + version + '/' + path
+
+    async def _request(self, method, uri: str, signed: bool, force_params: bool = False, **kwargs):
+        raise Exception('Unimplemented')
+
+    async def _request_api(self, method, path: str, signed: bool = False, version: str = PRIVATE_API_VERSION, **kwargs):
+        return await self._request(method, self._create_api_uri(path, version), signed, **kwargs)
+
+    async def _get(self, path: str, signed: bool = False, version: str = PRIVATE_API_VERSION, **kwargs):
+        return await self._request_api('get', path, signed, version, **kwargs)
+
+    async def _post(self, path: str, signed: bool = False, version: str = PRIVATE_API_VERSION, **kwargs):
+        return await self._request_api('post', path, signed, version, **kwargs)
+
+    async def _put(self, path: str, signed: bool = False, version: str = PRIVATE_API_VERSION, **kwargs):
+        return await self._request_api('put', path, signed, version, **kwargs)
+
+    async def _delete(self, path: str, signed: bool = False, version: str = PRIVATE_API_VERSION, **kwargs):
+        return await self._request_api('delete', path, signed, version, **kwargs)
+
+    async def get_server_time(self):
+        """ Check Server Time
+
+            https://binance-docs.github.io/apidocs/spot/en/#check-server-time
+        """
+        return await self._get('time')
+
+    async def get_all_tickers(self):
+        """ Symbol Price Ticker of all symbols (MARKET_DATA)
+
+            https://binance-docs.github.io/apidocs/spot/en/#symbol-price-ticker
+        """
+        return await self._get('ticker/price')
+
+    async def get_symbol_ticker(self, **params):
+        """ Symbol Price Ticker of `symbol` or `symbols` (MARKET_DATA)
+
+            https://binance-docs.github.io/apidocs/spot/en/#symbol-price-ticker
+        """
+        return await self._get('ticker/price', data=params)
+
+    async def stream_get_listen_key(self):
+        answer = await self._post('userDataStream')
+
+        return answer['listenKey']
+
+    async def stream_keepalive(self, listen_key):
+        return await self._put('userDataStream', data={ 'listenKey': listen_key })
+
+    async def stream_close(self, listen_key):
+        return await self._delete('userDataStream', data={ 'listenKey': listen_key })
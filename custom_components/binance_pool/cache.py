@@ -0,0 +1,122 @@
+"""
+TTL cache of slow-changing Binance API answers
+"""
+
+import logging
+import time
+
+from asyncio import (
+    get_running_loop
+)
+
+from .const import (
+    CACHE_TTLS
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BinanceResponseCache:
+    """Answers by key with stale-while-revalidate
+
+        A fresh entry is returned as is. An expired entry younger than `max_age`
+        is returned at once while a background request refreshes it, older ones
+        are requested again before returning.
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.on_change = None
+
+        self._refreshing = {}
+
+    async def async_get(self, key, ttl, max_age, fetch):
+        entry = self.entries.get(key)
+        now = time.time()
+
+        if entry:
+            stored, value = entry
+
+            if now - stored < ttl:
+                self.hits += 1
+                return value
+
+            if now - stored < max_age:
+                self.stale += 1
+
+                if key not in self._refreshing:
+                    self._refreshing[key] = get_running_loop().create_task(self._async_refresh(key, fetch))
+
+                return value
+
+        self.misses += 1
+
+        return await self._async_fetch(key, fetch)
+
+    def get(self, key, max_age):
+        """Value of an entry younger than `max_age` without requesting it, None otherwise"""
+        entry = self.entries.get(key)
+
+        if entry and time.time() - entry[0] < max_age:
+            return entry[1]
+
+        return None
+
+    def set(self, key, value):
+        self.entries[key] = (time.time(), value)
+
+        if self.on_change:
+            self.on_change()
+
+    async def _async_fetch(self, key, fetch):
+        value = await fetch()
+
+        if value:
+            self.entries[key] = (time.time(), value)
+
+            if self.on_change:
+                self.on_change()
+
+        return value
+
+    async def _async_refresh(self, key, fetch):
+        try:
+            await self._async_fetch(key, fetch)
+
+        except Exception as e:
+            _LOGGER.debug(f"Cached {key} not revalidated: {e}")
+
+        finally:
+            self._refreshing.pop(key, None)
+
+    def dump(self):
+        return { key: [stored, value] for key, (stored, value) in self.entries.items() }
+
+    def restore(self, data):
+        """Add saved entries younger than the maximum age of their key in CACHE_TTLS"""
+        now = time.time()
+
+        for key, (stored, value) in data.items():
+            ttls = CACHE_TTLS.get(key.split(':')[0])
+
+            if ttls and now - stored < ttls[1]:
+                self.entries.setdefault(key, (stored, value))
+
+    def cancel(self):
+        """Stop background refreshes still running"""
+        for task in self._refreshing.values():
+            task.cancel()
+
+        self._refreshing.clear()
+
+    def as_dict(self):
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale
+        }
@@ -1,33 +1,291 @@
+import copy
+import json
 import logging
+import math
+import time
+
+from email.utils import (
+    parsedate_to_datetime
+)
+
+import yarl
+
+from urllib.parse import (
+    quote
+)
+
+from asyncio import (
+    CancelledError,
+    TimeoutError,
+    gather,
+    get_running_loop,
+    shield,
+    sleep
+)
 
 from aiohttp import (
-    ClientSession
+    ClientError,
+    ClientSession,
+    ClientTimeout
 )
 
-from binance.async_client import (
-    AsyncClient
+from .const import (
+    RATE_LIMIT_RETRY_AFTER,
+    DEFAULT_RECV_WINDOW,
+    TIME_SYNC_INTERVAL,
+    TIME_SYNC_MIN_INTERVAL,
+    TIME_DRIFT_TOLERANCE,
+    ERROR_TIMESTAMP_OUTSIDE_RECV_WINDOW,
+    MINING_PAGE_CONCURRENCY,
+    CACHE_TTLS,
+    HEADER_API_USED_WEIGHT,
+    HEADER_SAPI_USED_IP_WEIGHT,
+    HEADER_SAPI_USED_UID_WEIGHT
 )
 
-from binance.exceptions import *
+from .api import (
+    BinanceAsyncClient,
+    BinanceAPIException,
+    BinanceRequestException
+)
+
+from .session import (
+    BinanceConnection
+)
+
+from .ratelimit import (
+    get_request_weight
+)
+
+from .retry import (
+    RetryPolicy
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-class BinancePoolClient(AsyncClient):
+class BinancePoolClient(BinanceAsyncClient):
     MINING_API_URL = 'https://api.binance.{}/sapi'
     BALANCES_API_URL = 'https://api.binance.{}/sapi'
     MINING_API_VERSION = 'v1'
     BALANCES_API_VERSION = 'v1'
-    RECV_WINDOW = 50000
+    
+    def __init__(self, api_key=None, api_secret=None, connection=None, tld='com'):
+        """Initialize.
+        
+            The client borrows session and weight limits of the `connection` shared 
+            by its domain and passes API key headers per request instead of per session.
+            Without `connection` a private one is created and closed with the client.
+        """
+        self._owns_connection = connection is None
+        self.connection = connection or BinanceConnection(tld)
+        
+        super().__init__(api_key, api_secret, tld)
+        
+        self.uid_limiter = self.connection.get_uid_limiter(api_key)
+        self.retry_policy = RetryPolicy()
+        self.recv_window = DEFAULT_RECV_WINDOW
+        
+    @property
+    def timestamp_offset(self) -> int:
+        """Server time minus local time in ms, shared by all clients of the connection"""
+        return self.connection.time_offset
+        
+    def _time_sync_due(self) -> bool:
+        synced_at = self.connection.time_synced_at
+        
+        return synced_at is None or time.time() - synced_at > TIME_SYNC_INTERVAL
+        
+    async def async_sync_time(self):
+        """Measure the server time offset with /api/v3/time, at most once per TIME_SYNC_MIN_INTERVAL per connection"""
+        connection = self.connection
+        
+        async with connection.time_lock:
+            if connection.time_synced_at and time.time() - connection.time_synced_at < TIME_SYNC_MIN_INTERVAL:
+                return
+            
+            started = time.time()
+            answer = await self.get_server_time()
+            finished = time.time()
+            
+            connection.time_offset = int(answer["serverTime"] - (started + finished) * 500)
+            connection.time_synced_at = finished
+            
+            _LOGGER.debug(f"Server time offset of binance.{connection.tld} is {connection.time_offset}ms")
+            
+    def _check_server_date(self, response):
+        """Request a new time sync when the Date header shows local time drifted from the measured offset"""
+        
+        date = response.headers.get('Date')
+        if not date or self.connection.time_synced_at is None:
+            return
+        
+        try:
+            server = parsedate_to_datetime(date).timestamp() * 1000
+        except (TypeError, ValueError):
+            return
+        
+        if abs(server - (time.time() * 1000 + self.connection.time_offset)) > TIME_DRIFT_TOLERANCE:
+            _LOGGER.debug(f"Clock drift from binance.{self.connection.tld} detected by Date header")
+            self.connection.time_synced_at = None
     
     def _init_session(self) -> ClientSession:
-        return ClientSession(
-            loop=self.loop,
-            headers=self._get_headers()
-        )
+        return self.connection.get_session()
+    
+    async def close_connection(self):
+        if self._owns_connection:
+            await self.connection.async_close()
+    
+    async def _async_acquire_weight(self, uri: str, signed: bool, data = None):
+        path = yarl.URL(uri).path
+        params = '&'.join(f"{key}={value}" for key, value in data.items()) if isinstance(data, dict) else None
+        weight = get_request_weight(path, params)
+
+        if '/sapi/' in path:
+            await self.connection.limiters['sapi'].async_acquire(weight)
+            
+            if signed:
+                await self.uid_limiter.async_acquire(weight)
+        else:
+            await self.connection.limiters['api'].async_acquire(weight)
+    
+    def _update_weight(self, uri: str, response):
+        headers = response.headers
+        
+        if '/sapi/' in uri:
+            limiters = [ 
+                (self.connection.limiters['sapi'], HEADER_SAPI_USED_IP_WEIGHT), 
+                (self.uid_limiter, HEADER_SAPI_USED_UID_WEIGHT) 
+            ]
+        else:
+            limiters = [ (self.connection.limiters['api'], HEADER_API_USED_WEIGHT) ]
+
+        for limiter, header in limiters:
+            used = headers.get(header)
+            if used and used.isdigit():
+                limiter.update(used)
+                
+            if response.status in (418, 429):
+                retry_after = headers.get('Retry-After', '')
+                limiter.block(int(retry_after) if retry_after.isdigit() else RATE_LIMIT_RETRY_AFTER)
+    
+    async def _request(self, method, uri: str, signed: bool, force_params: bool = False, **kwargs):
+        """Identical concurrent requests share one flight
+
+            Requests are identical by method, URI, parameters and, for signed ones,
+            API key. The first caller receives the decoded answer, others its copy.
+        """
+        data = kwargs.get('data')
+        params = tuple(sorted((key, str(value)) for key, value in data.items())) if isinstance(data, dict) else ()
+        key = (method, uri, params, self.API_KEY if signed else None)
+        
+        inflight = self.connection.inflight
+        
+        if key in inflight:
+            self.connection.coalesced += 1
+            return copy.deepcopy(await shield(inflight[key]))
+        
+        task = inflight[key] = get_running_loop().create_task(self._async_send_with_retry(method, uri, signed, force_params, **kwargs))
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+        
+        return await shield(task)
+    
+    async def _async_send_with_retry(self, method, uri: str, signed: bool, force_params: bool = False, **kwargs):
+        """Retry server errors and transport failures by `retry_policy` behind the circuit breaker of the endpoint
+        
+            Client errors (4xx) are raised at once and do not count as endpoint failures.
+        """
+        breaker = self.connection.get_breaker(yarl.URL(uri).path)
+        
+        if not breaker.allow():
+            raise BinanceRequestException(f"{breaker.name} is paused after repeated failures")
+        
+        data = kwargs.get('data')
+        outcome = None
+        
+        try:
+            if signed and self._time_sync_due():
+                try:
+                    await self.async_sync_time()
+                    
+                except (BinanceAPIException, BinanceRequestException, ClientError, TimeoutError) as e:
+                    _LOGGER.debug(f"Server time of binance.{self.connection.tld} not synchronized: {e}")
+            
+            for attempt in range(self.retry_policy.attempts):
+                if isinstance(data, dict):
+                    kwargs['data'] = dict(data)
+                    
+                try:
+                    answer = await self._async_send_request(method, uri, signed, force_params, **kwargs)
+                    
+                except BinanceAPIException as e:
+                    if signed and e.code == ERROR_TIMESTAMP_OUTSIDE_RECV_WINDOW and attempt + 1 < self.retry_policy.attempts:
+                        _LOGGER.debug(f"Timestamp rejected by binance.{self.connection.tld}, synchronizing time")
+                        
+                        self.connection.time_synced_at = None
+                        await self.async_sync_time()
+                        continue
+                    
+                    if not self.retry_policy.is_retryable(e.status_code):
+                        outcome = "success"
+                        raise
+                    
+                    error = e
+                    retry_after = e.response.headers.get('Retry-After') if getattr(e, 'response', None) is not None else None
+                    
+                except (ClientError, TimeoutError) as e:
+                    error = e
+                    retry_after = None
+                    
+                else:
+                    outcome = "success"
+                    return answer
+                
+                if attempt + 1 < self.retry_policy.attempts:
+                    delay = self.retry_policy.get_delay(attempt, retry_after)
+                    _LOGGER.debug(f"Retrying {method.upper()} {yarl.URL(uri).path} in {delay:.1f}s after: {error}")
+                    
+                    await sleep(delay)
+                    
+            raise error
+        
+        except CancelledError:
+            outcome = outcome or "cancelled"
+            raise
+        
+        finally:
+            # every other exit, invalid answers and failed time sync included, counts as a failure
+            if outcome == "success":
+                breaker.record_success()
+            elif outcome == "cancelled":
+                breaker.release()
+            else:
+                breaker.record_failure()
+    
+    async def _async_send_request(self, method, uri: str, signed: bool, force_params: bool = False, **kwargs):
+        await self._async_acquire_weight(uri, signed, kwargs.get('data'))
+        
+        headers = self._get_headers()
+        
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+        if not isinstance(kwargs.get('timeout'), ClientTimeout):
+            kwargs['timeout'] = ClientTimeout(total=kwargs.get('timeout', self.REQUEST_TIMEOUT))
+        
+        if 'params' in kwargs:
+            uri = f"{uri}?{kwargs.pop('params')}"
+        
+        if not self.session or self.session.closed:
+            self.session = self._init_session()
+        
+        async with getattr(self.session, method)(yarl.URL(uri, encoded=True), headers=headers, **kwargs) as response:
+            self.response = response
+            self._update_weight(uri, response)
+            self._check_server_date(response)
+            
+            return await self._handle_response(response)
     
     def _get_request_kwargs(self, method, signed: bool, force_params: bool = False, **kwargs):
         if signed:
-            kwargs['data']['recvWindow'] = self.RECV_WINDOW
+            kwargs['data'] = { **(kwargs.get('data') or {}), 'recvWindow': self.recv_window }
             
         return super()._get_request_kwargs(method, signed, force_params, **kwargs)
     
@@ -44,7 +302,8 @@ class BinancePoolClient(AsyncClient):
             answer = await self._request(method, uri, signed, True, **kwargs)
         
         except BinanceAPIException as ex:
-            raise BinanceAPIException(f'{ex} !!! Incoming( Method: {method}, URI: {uri})')
+            ex.message = f'{ex.message} !!! Incoming( Method: {method}, URI: {uri})'
+            raise
                 
         
         if answer["code"] != 0 or "data" not in answer:
@@ -52,6 +311,12 @@ class BinancePoolClient(AsyncClient):
         
         return answer["data"]
 
+    async def async_request_cached_mining_api(self, path):
+        """Public mining answers through the shared cache, TTLs by path are in CACHE_TTLS"""
+        ttl, max_age = CACHE_TTLS[f"mining/{path}"]
+        
+        return await self.connection.cache.async_get(f"mining/{path}", ttl, max_age, lambda: self.async_request_mining_api('get', path))
+
     async def async_request_capital_api(self, method, path, signed=False, **kwargs):
         uri = self._create_capital_api_url(path)
         
@@ -59,7 +324,8 @@ class BinancePoolClient(AsyncClient):
             answer = await self._request(method, uri, signed, True, **kwargs)
         
         except BinanceAPIException as ex:
-            raise BinanceAPIException(f'{ex} !!! Incoming( Method: {method}, URI: {uri})')
+            ex.message = f'{ex.message} !!! Incoming( Method: {method}, URI: {uri})'
+            raise
                 
         return answer
         
@@ -70,7 +336,8 @@ class BinancePoolClient(AsyncClient):
             answer = await self._request(method, uri, signed, **kwargs)        
         
         except BinanceAPIException as ex:
-            raise BinanceAPIException(f'{ex} !!! Incoming( Method: {method}, URI: {uri})')
+            ex.message = f'{ex.message} !!! Incoming( Method: {method}, URI: {uri})'
+            raise
                 
         return answer        
         
@@ -80,7 +347,7 @@ class BinancePoolClient(AsyncClient):
             https://binance-docs.github.io/apidocs/spot/en/#acquiring-algorithm-market_data
             
         """
-        return await self.async_request_mining_api('get', 'pub/algoList')
+        return await self.async_request_cached_mining_api('pub/algoList')
 
 
     async def async_get_mining_coinlist(self):
@@ -88,7 +355,7 @@ class BinancePoolClient(AsyncClient):
         
             https://binance-docs.github.io/apidocs/spot/en/#acquiring-coinname-market_data
         """
-        return await self.async_request_mining_api('get', 'pub/coinList')        
+        return await self.async_request_cached_mining_api('pub/coinList')        
 
 
     async def async_get_mining_worker_detail(self, **params):
@@ -107,6 +374,32 @@ class BinancePoolClient(AsyncClient):
         return await self.async_request_mining_api('get', 'worker/list', True, data=params)        
         
     
+    async def async_iter_mining_workers(self, concurrency = MINING_PAGE_CONCURRENCY, **params):
+        """ Workers of all worker/list pages, one list per page in page order
+
+            The first page tells the number of pages, the others are requested 
+            `concurrency` at a time and paced by the weight limiters. A batch is 
+            awaited as a whole, its first error is raised after all its requests ended.
+        """
+        first = await self.async_get_mining_worker_list(pageIndex=1, **params)
+        if not first:
+            return
+        
+        yield first.get("workerDatas") or []
+        
+        size = int(first.get("pageSize") or 0)
+        pages = math.ceil(int(first.get("totalNum") or 0) / size) if size else 1
+        
+        for start in range(2, pages + 1, concurrency):
+            requests = [ self.async_get_mining_worker_list(pageIndex=index, **params) for index in range(start, min(start + concurrency, pages + 1)) ]
+            
+            for page in await gather(*requests, return_exceptions=True):
+                if isinstance(page, Exception):
+                    raise page
+                
+                yield (page or {}).get("workerDatas") or []
+                
+    
     async def async_get_mining_earning_history(self, **params):
         """ Earnings List(USER_DATA)
 
@@ -159,3 +452,79 @@ class BinancePoolClient(AsyncClient):
             https://binance-docs.github.io/apidocs/spot/en/#simple-account-user_data
         """
         return await self.async_request_margin_api('get', 'simple-earn/account', True, data=params)
+
+
+    async def async_get_exchange_symbols(self, symbols):
+        """ (base, quote) by symbol from Exchange Information, each symbol cached on its own
+        
+            Symbols missing from the cache or older than its TTL are requested at once. If the
+            request fails, entries up to the maximum age are used, the error is raised when 
+            some symbol is still unknown.
+        
+            https://binance-docs.github.io/apidocs/spot/en/#exchange-information
+        """
+        cache = self.connection.cache
+        ttl, max_age = CACHE_TTLS["exchangeInfo"]
+        
+        def cached(symbol, age):
+            pair = cache.get(f"exchangeInfo:{symbol}", age)
+            return tuple(pair) if isinstance(pair, (list, tuple)) and len(pair) == 2 else None
+        
+        pairs = { symbol: cached(symbol, ttl) for symbol in symbols }
+        missing = sorted(symbol for symbol, pair in pairs.items() if pair is None)
+        
+        cache.hits += len(symbols) - len(missing)
+        cache.misses += len(missing)
+        
+        if missing:
+            params = { 'symbols': quote(json.dumps(missing, separators=(',', ':'))) }
+            
+            try:
+                info = await self._get('exchangeInfo', data=params, version=self.PRIVATE_API_VERSION)
+                
+            except (BinanceAPIException, BinanceRequestException, ClientError, TimeoutError):
+                pairs.update((symbol, cached(symbol, max_age)) for symbol in missing)
+                
+                if any(pair is None for pair in pairs.values()):
+                    raise
+                
+                cache.stale += len(missing)
+                
+            else:
+                for item in info.get("symbols", []) if info else []:
+                    pair = pairs[item["symbol"]] = (item["baseAsset"], item["quoteAsset"])
+                    cache.set(f"exchangeInfo:{item['symbol']}", pair)
+        
+        return { symbol: pair for symbol, pair in pairs.items() if pair }
+
+
+    async def async_get_listen_key(self):
+        """ Create a ListenKey (USER_STREAM)
+        
+            https://binance-docs.github.io/apidocs/spot/en/#listen-key-spot
+        """
+        return await self.stream_get_listen_key()
+
+
+    async def async_keepalive_listen_key(self, listen_key):
+        """ Ping/Keep-alive a ListenKey (USER_STREAM)
+        
+            https://binance-docs.github.io/apidocs/spot/en/#listen-key-spot
+        """
+        return await self.stream_keepalive(listen_key)
+
+
+    async def async_close_listen_key(self, listen_key):
+        """ Close a ListenKey (USER_STREAM)
+        
+            https://binance-docs.github.io/apidocs/spot/en/#listen-key-spot
+        """
+        return await self.stream_close(listen_key)
+
+
+    async def async_get_symbol_tickers(self, symbols):
+        """ Symbol Price Ticker for the list of symbols (MARKET_DATA)
+        
+            https://binance-docs.github.io/apidocs/spot/en/#symbol-price-ticker
+        """
+        return await self.get_symbol_ticker(symbols=quote(json.dumps(symbols, separators=(',', ':'))))
@@ -86,7 +86,9 @@ class BinancePoolConfigFlow(ConfigFlow, domain=DOMAIN):
                 tld = user_input[CONF_DOMAIN]
 
                 from .client import BinancePoolClient, BinanceAPIException, BinanceRequestException
-                client = BinancePoolClient(api_key, api_secret, tld=tld)
+                from .session import async_get_connection
+                
+                client = BinancePoolClient(api_key, api_secret, connection=async_get_connection(self.hass, tld), tld=tld)
                                     
                 try: 
                     tasks = [
@@ -277,8 +279,9 @@ class BinancePoolOptionsFlow(OptionsFlow):
         if not self.api_data:
         
             from .client import BinancePoolClient
+            from .session import async_get_connection
                             
-            client = BinancePoolClient(user_input[CONF_API_KEY], user_input[CONF_API_SECRET], tld=user_input[CONF_DOMAIN])
+            client = BinancePoolClient(user_input[CONF_API_KEY], user_input[CONF_API_SECRET], connection=async_get_connection(self.hass, user_input[CONF_DOMAIN]), tld=user_input[CONF_DOMAIN])
      
             tasks = [
                 client.async_get_capital_balances(),
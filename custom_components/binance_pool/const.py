@@ -13,9 +13,125 @@ CONF_EXCHANGES = "exchanges"
 CONF_MINING = "miners"
 CONF_DOMAIN = "domain"
 CONF_NATIVE_CURRENCY = "native_currency"
+CONF_MINING_CONCURRENCY = "mining_concurrency"
+CONF_MARKET_STREAM = "market_stream"
+CONF_MARKET_STREAM_INTERVAL = "market_stream_interval"
+CONF_USER_STREAM = "user_stream"
+CONF_USER_STREAM_RECONCILE = "user_stream_reconcile"
+CONF_WORKER_TABLE = "worker_table"
+CONF_WORKERS = "workers"
+CONF_INTERVALS = "intervals"
+CONF_RECV_WINDOW = "recv_window"
+CONF_RETRY_ATTEMPTS = "retry_attempts"
+CONF_RETRY_BACKOFF = "retry_backoff"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_ABSOLUTE = "absolute"
+CONF_DEADBAND_RELATIVE = "relative"
+CONF_DEADBAND_MIN_INTERVAL = "min_interval"
 
-MIN_TIME_BETWEEN_UPDATES = 1
-MIN_TIME_BETWEEN_MINING_UPDATES = 5
+SENSOR_TYPES = [ "balance", "funding", "savings", "exchange", "worker", "worker_table", "status", "profit" ]
+
+WORKER_TABLE_MAX_ROWS = 100
+
+DEFAULT_MINING_CONCURRENCY = 4
+MINING_PAGE_CONCURRENCY = 4
+DEFAULT_MARKET_STREAM_INTERVAL = 5
+DEFAULT_USER_STREAM_RECONCILE = 30
+
+MARKET_STREAM_OFF = "off"
+MARKET_STREAM_MINI_TICKER = "miniTicker"
+MARKET_STREAM_BOOK_TICKER = "bookTicker"
+MARKET_STREAM_URL = "wss://stream.binance.{}:9443/stream"
+USER_STREAM_URL = "wss://stream.binance.{}:9443/ws"
+USER_STREAM_KEEPALIVE_INTERVAL = 30
+
+STREAM_HEARTBEAT = 30
+STREAM_RECONNECT_MAX_DELAY = 60
+
+WALLET_SOURCES = [ "prices", "balances", "funding", "savings" ]
+MINING_SOURCES = [ "lists", "workers", "status" ]
+
+STALE_MAX_AGE = 3600
+
+SENSOR_SOURCES = {
+    "balance": "balances",
+    "funding": "funding",
+    "savings": "savings",
+    "exchange": "prices",
+    "worker": "workers",
+    "worker_table": "workers",
+    "status": "status",
+    "profit": "status"
+}
+
+DEFAULT_INTERVALS = {
+    "prices": 15,
+    "balances": 60,
+    "funding": 60,
+    "savings": 900,
+    "lists": 86400,
+    "workers": 300,
+    "status": 300
+}
+TICKERS_FULL_UPDATE_INTERVAL = 60
+TICKERS_SYMBOLS_LIMIT = 100
+
+SAVINGS_COINS = [ "BTC", "USDT" ]
+
+CONVERSION_BRIDGES = [ "USDT", "BTC", "ETH", "BNB", "FDUSD", "USDC", "EUR" ]
+
+DATA_CONNECTIONS = "connections"
+
+DEFAULT_RECV_WINDOW = 5000
+TIME_SYNC_INTERVAL = 3600
+TIME_SYNC_MIN_INTERVAL = 10
+TIME_DRIFT_TOLERANCE = 2000
+ERROR_TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 1.0
+RETRY_MAX_DELAY = 30
+BREAKER_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 300
+BREAKER_MAX_RESET_TIMEOUT = 3600
+
+CONNECTION_LIMIT = 32
+CONNECTION_LIMIT_PER_HOST = 16
+CONNECTION_DNS_CACHE_TTL = 300
+CONNECTION_KEEPALIVE_TIMEOUT = 60
+
+API_IP_WEIGHT_LIMIT = 6000
+SAPI_IP_WEIGHT_LIMIT = 12000
+SAPI_UID_WEIGHT_LIMIT = 180000
+RATE_LIMIT_HEADROOM = 0.8
+RATE_LIMIT_RETRY_AFTER = 60
+
+HEADER_API_USED_WEIGHT = "X-MBX-USED-WEIGHT-1M"
+HEADER_SAPI_USED_IP_WEIGHT = "X-SAPI-USED-IP-WEIGHT-1M"
+HEADER_SAPI_USED_UID_WEIGHT = "X-SAPI-USED-UID-WEIGHT-1M"
+
+CACHE_STORAGE_KEY = "binance_pool.cache"
+CACHE_STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 60
+
+SNAPSHOT_STORAGE_KEY = "binance_pool.snapshot.{}"
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+CACHE_TTLS = {
+    "mining/pub/coinList": (86400, 7 * 86400),
+    "mining/pub/algoList": (86400, 7 * 86400),
+    "exchangeInfo": (86400, 30 * 86400)
+}
+
+REQUEST_WEIGHT_DEFAULT = 1
+REQUEST_WEIGHTS = [
+    ("mining/pub/", 1),
+    ("mining/", 5),
+    ("capital/config/getall", 10),
+    ("asset/get-funding-asset", 1),
+    ("simple-earn/account", 150),
+    ("exchangeInfo", 20)
+]
 
 COORDINATOR_MINING = f'mining'
 COORDINATOR_WALLET = f'wallet'
@@ -54,6 +170,11 @@ ATTR_WORKER_REJECT = "reject_rate"
 ATTR_WORKER_WORKER = "worker_name"
 ATTR_WORKER_UPDATE = "updated"
 
+ATTR_DATA_UPDATED = "data updated"
+
+ATTR_WORKER_TABLE = "workers table"
+ATTR_WORKER_TABLE_TRUNCATED = "workers not in table"
+
 ATTR_STATUS_HRATE15M = "average hashrate (15 mins)"
 ATTR_STATUS_HRATE24H = "average hashrate (24 hours)"
 ATTR_STATUS_VALID_WORKERS = "valid workers"
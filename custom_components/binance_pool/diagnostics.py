@@ -0,0 +1,56 @@
+"""
+Diagnostics support for Binance Pool
+"""
+
+from homeassistant.components.diagnostics import (
+    async_redact_data
+)
+
+from homeassistant.const import (
+    CONF_API_KEY
+)
+
+from .const import (
+    DOMAIN,
+    CONF_API_SECRET,
+    COORDINATOR_WALLET,
+    COORDINATOR_MINING
+)
+
+TO_REDACT = { CONF_API_KEY, CONF_API_SECRET }
+
+
+async def async_get_config_entry_diagnostics(hass, config_entry):
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    client = data['coordinator'][COORDINATOR_WALLET].client
+    connection = client.connection
+
+    return {
+        "config": async_redact_data(data['config'], TO_REDACT),
+        "state_writes": {
+            **data['coordinator'][COORDINATOR_WALLET].write_stats,
+            **data['coordinator'][COORDINATOR_MINING].write_stats
+        },
+        "schedules": {
+            coordinator.name: {
+                source: {
+                    "interval": interval.total_seconds(),
+                    "due": coordinator.due[source].isoformat() if source in coordinator.due else None,
+                    "updated": coordinator.updated[source].isoformat() if source in coordinator.updated else None,
+                    "failing_since": coordinator.failures[source].isoformat() if source in coordinator.failures else None
+                } for source, interval in coordinator.intervals.items()
+            } for coordinator in data['coordinator'].values()
+        },
+        "connection": {
+            "tld": connection.tld,
+            "time_offset": connection.time_offset,
+            "time_synced_at": connection.time_synced_at,
+            "cache": connection.cache.as_dict(),
+            "coalesced_requests": connection.coalesced,
+            "breakers": { path: breaker.as_dict() for path, breaker in connection.breakers.items() },
+            "limits": {
+                **{ name: limiter.as_dict() for name, limiter in connection.limiters.items() },
+                "uid": client.uid_limiter.as_dict()
+            }
+        }
+    }
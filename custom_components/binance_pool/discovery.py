@@ -0,0 +1,73 @@
+"""
+Sensor descriptors derived from coordinator data
+"""
+
+from .const import (
+    CONF_BALANCES,
+    CONF_EXCHANGES,
+    CONF_MINING,
+    CONF_NATIVE_CURRENCY,
+    CONF_WORKER_TABLE,
+    CONF_WORKERS,
+    SAVINGS_COINS
+)
+
+from .models import (
+    BalanceDescriptor,
+    FundingDescriptor,
+    SavingsDescriptor,
+    ExchangeDescriptor,
+    WorkerDescriptor,
+    WorkerTableDescriptor,
+    StatusDescriptor,
+    ProfitDescriptor
+)
+
+
+def get_sensor_descriptors(name, config, wallet, mining) -> list:
+    """Descriptors of every sensor the current coordinator data allows for the config"""
+    
+    sensors = []
+    native = tuple(config[CONF_NATIVE_CURRENCY])
+    
+    for balance in wallet.balances:
+        if not config[CONF_BALANCES] or balance.coin in config[CONF_BALANCES]:
+            sensors.append(BalanceDescriptor(name, balance.coin, native))
+            sensors.append(FundingDescriptor(name, balance.coin, native))
+                
+    for coin in SAVINGS_COINS:
+        sensors.append(SavingsDescriptor(name, coin, native))
+
+    for symbol in wallet.prices:
+        if not config[CONF_EXCHANGES] or symbol in config[CONF_EXCHANGES]:
+            sensors.append(ExchangeDescriptor(name, symbol))
+
+    if config[CONF_MINING]:
+        for account, algos in mining.mining.items():
+            for algo, typ in algos.items():
+                if "workers" in typ:
+                    if config.get(CONF_WORKER_TABLE):
+                        sensors.append(WorkerTableDescriptor(name, account, algo))
+                    
+                    for worker in typ["workers"]:
+                        if not config.get(CONF_WORKER_TABLE) or worker.name in config.get(CONF_WORKERS, []):
+                            sensors.append(WorkerDescriptor(name, account, algo, worker.name))
+                        
+                if "status" in typ:
+                    for coin in mining.algo_coins.get(algo, ()):
+                        sensors.append(ProfitDescriptor(name, account, algo, coin, native))
+
+                    sensors.append(StatusDescriptor(name, account, algo))
+                    
+    return sensors
+
+
+def require_sensor_data(wallet, descriptors):
+    """Request prices needed by the sensors on next wallet updates"""
+    
+    for descriptor in descriptors:
+        if isinstance(descriptor, ExchangeDescriptor):
+            wallet.require_symbol(descriptor.symbol)
+            
+        elif hasattr(descriptor, "native"):
+            wallet.require_conversion(descriptor.coin, descriptor.native)
@@ -0,0 +1,182 @@
+"""
+Compact data records of Binance coordinators
+"""
+
+from array import (
+    array
+)
+
+from typing import (
+    NamedTuple
+)
+
+WORKER_STATUSES = [ "unknown", "valid", "invalid", "inactive" ]
+
+
+class WorkerRecord:
+    """Values of one worker from mining/worker/list"""
+
+    __slots__ = ( "name", "status", "hashrate", "day_hashrate", "reject", "last_share" )
+
+    def __init__(self, name, status = 0, hashrate = 0.0, day_hashrate = 0.0, reject = 0.0, last_share = 0):
+        """Initialize."""
+        self.name = name
+        self.status = status
+        self.hashrate = hashrate
+        self.day_hashrate = day_hashrate
+        self.reject = reject
+        self.last_share = last_share
+
+    @classmethod
+    def from_dict(cls, worker):
+        return cls(
+            worker["workerName"],
+            int(worker["status"]),
+            float(worker["hashRate"]),
+            float(worker["dayHashRate"]),
+            float(worker["rejectRate"]),
+            int(worker["lastShareTime"])
+        )
+
+    def values(self):
+        return (self.status, self.hashrate, self.day_hashrate, self.reject, self.last_share)
+
+
+class BalanceRecord:
+    """Amounts of one coin of the spot or funding wallet"""
+
+    __slots__ = ( "coin", "free", "locked", "freeze", "withdrawing" )
+
+    def __init__(self, coin, free = 0.0, locked = 0.0, freeze = 0.0, withdrawing = 0.0):
+        """Initialize."""
+        self.coin = coin
+        self.free = free
+        self.locked = locked
+        self.freeze = freeze
+        self.withdrawing = withdrawing
+
+    @classmethod
+    def from_dict(cls, balance, key = "coin"):
+        return cls(
+            balance[key],
+            float(balance.get("free", 0)),
+            float(balance.get("locked", 0)),
+            float(balance.get("freeze", 0)),
+            float(balance.get("withdrawing", 0))
+        )
+
+    @property
+    def total(self):
+        return self.free + self.locked + self.freeze
+
+    def values(self):
+        return (self.free, self.locked, self.freeze, self.withdrawing)
+
+
+class BalanceDescriptor(NamedTuple):
+    """Spot wallet balance sensor of a coin"""
+    name: str
+    coin: str
+    native: list
+
+
+class FundingDescriptor(NamedTuple):
+    """Funding wallet sensor of a coin"""
+    name: str
+    coin: str
+    native: list
+
+
+class SavingsDescriptor(NamedTuple):
+    """Simple Earn savings sensor of a coin"""
+    name: str
+    coin: str
+    native: list
+
+
+class ExchangeDescriptor(NamedTuple):
+    """Price sensor of an exchange pair"""
+    name: str
+    symbol: str
+
+
+class WorkerDescriptor(NamedTuple):
+    """Sensor of one mining worker"""
+    name: str
+    account: str
+    algorithm: str
+    worker: str
+
+
+class WorkerTableDescriptor(NamedTuple):
+    """Aggregated workers sensor of (account, algorithm)"""
+    name: str
+    account: str
+    algorithm: str
+
+
+class StatusDescriptor(NamedTuple):
+    """Mining status sensor of (account, algorithm)"""
+    name: str
+    account: str
+    algorithm: str
+
+
+class ProfitDescriptor(NamedTuple):
+    """Mining profit sensor of (account, algorithm) in a coin"""
+    name: str
+    account: str
+    algorithm: str
+    coin: str
+    native: list
+
+
+class WorkerTable:
+    """Column-oriented workers of one (account, algo), one typed array per field"""
+
+    __slots__ = ( "names", "status", "hashrate", "day_hashrate", "reject", "last_share" )
+
+    def __init__(self, workers = ()):
+        """Initialize from WorkerRecord items."""
+        self.names = tuple(worker.name for worker in workers)
+        self.status = array('b', (worker.status for worker in workers))
+        self.hashrate = array('d', (worker.hashrate for worker in workers))
+        self.day_hashrate = array('d', (worker.day_hashrate for worker in workers))
+        self.reject = array('d', (worker.reject for worker in workers))
+        self.last_share = array('q', (worker.last_share for worker in workers))
+
+    def __len__(self):
+        return len(self.names)
+
+    def fingerprint(self):
+        """Comparable value of the whole table"""
+        return (self.names, self.status.tobytes(), self.hashrate.tobytes(), self.day_hashrate.tobytes(), self.reject.tobytes(), self.last_share.tobytes())
+
+    def summary(self):
+        counts = [ 0 ] * len(WORKER_STATUSES)
+        for status in self.status:
+            counts[status if 0 <= status < len(counts) else 0] += 1
+
+        total = sum(self.hashrate)
+
+        return {
+            "workers": len(self),
+            **{ f"{name} workers": count for name, count in zip(WORKER_STATUSES, counts) },
+            "total hashrate": total,
+            "average hashrate": total / len(self) if len(self) else 0,
+            "min hashrate": min(self.hashrate) if len(self) else 0,
+            "max hashrate": max(self.hashrate) if len(self) else 0
+        }
+
+    def columns(self, limit):
+        """Up to `limit` rows as columns, workers with problems first, then by hashrate"""
+
+        order = sorted(range(len(self)), key=lambda i: (self.status[i] == 1, -self.hashrate[i]))[:limit]
+
+        return {
+            "name": [ self.names[i] for i in order ],
+            "status": [ WORKER_STATUSES[self.status[i]] if 0 <= self.status[i] < len(WORKER_STATUSES) else WORKER_STATUSES[0] for i in order ],
+            "hashrate": [ self.hashrate[i] for i in order ],
+            "daily_hashrate": [ self.day_hashrate[i] for i in order ],
+            "reject_rate": [ self.reject[i] for i in order ]
+        }
@@ -0,0 +1,100 @@
+"""
+Request weight scheduling for Binance API limits
+"""
+
+import logging
+import time
+
+from asyncio import (
+    sleep
+)
+
+from .const import (
+    RATE_LIMIT_HEADROOM,
+    REQUEST_WEIGHTS,
+    REQUEST_WEIGHT_DEFAULT
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_request_weight(path: str, params: str = None) -> int:
+    """ Weight of a request by its API path
+
+        https://binance-docs.github.io/apidocs/spot/en/#limits
+    """
+    if path.endswith('ticker/price'):
+        return 2 if params and 'symbol=' in params else 4
+
+    for prefix, weight in REQUEST_WEIGHTS:
+        if prefix in path:
+            return weight
+
+    return REQUEST_WEIGHT_DEFAULT
+
+
+class BinanceWeightLimiter:
+    """Token bucket of one minute weight, synced with X-*-USED-WEIGHT-1M headers
+
+        Requests that do not fit into the rest of the current minute wait for the
+        next one, so lighter requests may pass ahead of heavier ones.
+    """
+
+    def __init__(self, name, limit, headroom = RATE_LIMIT_HEADROOM):
+        """Initialize."""
+        self.name = name
+        self.limit = limit
+        self.budget = int(limit * headroom)
+        self.used = 0
+        self.window = 0
+        self.blocked_until = 0
+        self.delayed = 0
+
+    def _roll(self, now):
+        window = int(now // 60)
+        if window != self.window:
+            self.window = window
+            self.used = 0
+
+    async def async_acquire(self, weight):
+        delayed = False
+
+        while True:
+            now = time.time()
+            self._roll(now)
+
+            if now < self.blocked_until:
+                wait = self.blocked_until - now
+
+            elif self.used + weight <= self.budget or self.used == 0:
+                self.used += weight
+                break
+
+            else:
+                wait = (self.window + 1) * 60 - now
+
+            if not delayed:
+                delayed = True
+                self.delayed += 1
+                _LOGGER.debug(f"Request of weight {weight} delayed for {wait:.1f}s by {self.name} limit ({self.used}/{self.limit})")
+
+            await sleep(wait)
+
+    def update(self, used):
+        """Apply the weight reported by the server for the current minute"""
+        self._roll(time.time())
+        self.used = max(self.used, int(used))
+
+    def block(self, retry_after):
+        """Stop all requests after 429/418 answers"""
+        self.blocked_until = max(self.blocked_until, time.time() + retry_after)
+
+        _LOGGER.warning(f"Binance {self.name} limit exceeded, requests paused for {retry_after}s")
+
+    def as_dict(self):
+        return {
+            "limit": self.limit,
+            "used": self.used,
+            "delayed": self.delayed,
+            "blocked_until": self.blocked_until
+        }
@@ -0,0 +1,111 @@
+"""
+Retries and circuit breakers of Binance API requests
+"""
+
+import logging
+import random
+import time
+
+from .const import (
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    RETRY_MAX_DELAY,
+    BREAKER_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    BREAKER_MAX_RESET_TIMEOUT
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, Retry-After of the server wins when given"""
+
+    def __init__(self, attempts = DEFAULT_RETRY_ATTEMPTS, backoff = DEFAULT_RETRY_BACKOFF, max_delay = RETRY_MAX_DELAY):
+        """Initialize."""
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_delay = max_delay
+
+    def get_delay(self, attempt, retry_after = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_delay)
+
+        return random.uniform(0, min(self.backoff * 2 ** attempt, self.max_delay))
+
+    @staticmethod
+    def is_retryable(status) -> bool:
+        """Server errors and transport failures (no status) are retried, client errors never"""
+        return status is None or status >= 500
+
+
+class BinanceCircuitBreaker:
+    """Consecutive failure counter of one endpoint
+
+        After `threshold` failures in a row the breaker opens and requests fail
+        at once. When `reset_timeout` passes one probe request goes through; its
+        success closes the breaker, its failure doubles the timeout.
+    """
+
+    def __init__(self, name, threshold = BREAKER_THRESHOLD, reset_timeout = BREAKER_RESET_TIMEOUT):
+        """Initialize."""
+        self.name = name
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+
+        return "half_open" if self.probing or time.time() >= self.opened_at + self.timeout else "open"
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+
+        if not self.probing and time.time() >= self.opened_at + self.timeout:
+            self.probing = True
+            _LOGGER.debug(f"Probing {self.name}")
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            _LOGGER.info(f"{self.name} recovered")
+
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.timeout = self.reset_timeout
+
+    def release(self):
+        """End a request without outcome, e.g. cancelled, so the next one may probe"""
+        self.probing = False
+
+    def record_failure(self):
+        self.failures += 1
+
+        if self.probing:
+            self.probing = False
+            self.opened_at = time.time()
+            self.timeout = min(self.timeout * 2, BREAKER_MAX_RESET_TIMEOUT)
+
+        elif self.opened_at is None and self.failures >= self.threshold:
+            self.opened_at = time.time()
+            _LOGGER.warning(f"{self.name} failed {self.failures} times in a row, requests paused for {self.timeout}s")
+
+    def as_dict(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retry_at": self.opened_at + self.timeout if self.opened_at is not None else None
+        }
@@ -18,7 +18,34 @@ from .const import (
     CONF_EXCHANGES,
     CONF_MINING,
     CONF_DOMAIN,
-    CONF_NATIVE_CURRENCY   
+    CONF_NATIVE_CURRENCY,
+    CONF_MINING_CONCURRENCY,
+    CONF_MARKET_STREAM,
+    CONF_MARKET_STREAM_INTERVAL,
+    CONF_USER_STREAM,
+    CONF_USER_STREAM_RECONCILE,
+    CONF_WORKER_TABLE,
+    CONF_WORKERS,
+    CONF_DEADBAND,
+    CONF_INTERVALS,
+    CONF_RECV_WINDOW,
+    DEFAULT_RECV_WINDOW,
+    CONF_RETRY_ATTEMPTS,
+    CONF_RETRY_BACKOFF,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BACKOFF,
+    WALLET_SOURCES,
+    MINING_SOURCES,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_DEADBAND_MIN_INTERVAL,
+    SENSOR_TYPES,
+    DEFAULT_MINING_CONCURRENCY,
+    DEFAULT_MARKET_STREAM_INTERVAL,
+    DEFAULT_USER_STREAM_RECONCILE,
+    MARKET_STREAM_OFF,
+    MARKET_STREAM_MINI_TICKER,
+    MARKET_STREAM_BOOK_TICKER
 )
 
 CONFIG_ENTRY_SCHEMA = vol.Schema(
@@ -38,7 +65,43 @@ CONFIG_ENTRY_SCHEMA = vol.Schema(
         ),
         vol.Optional(CONF_MINING, default=[]): vol.All(
             cv.ensure_list, [cv.string]
-        )
+        ),
+        vol.Optional(CONF_MINING_CONCURRENCY, default=DEFAULT_MINING_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+        vol.Optional(CONF_MARKET_STREAM, default=MARKET_STREAM_OFF): vol.In(
+            [MARKET_STREAM_OFF, MARKET_STREAM_MINI_TICKER, MARKET_STREAM_BOOK_TICKER]
+        ),
+        vol.Optional(CONF_MARKET_STREAM_INTERVAL, default=DEFAULT_MARKET_STREAM_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_USER_STREAM, default=False): cv.boolean,
+        vol.Optional(CONF_USER_STREAM_RECONCILE, default=DEFAULT_USER_STREAM_RECONCILE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_WORKER_TABLE, default=False): cv.boolean,
+        vol.Optional(CONF_WORKERS, default=[]): vol.All(
+            cv.ensure_list, [cv.string]
+        ),
+        vol.Optional(CONF_RECV_WINDOW, default=DEFAULT_RECV_WINDOW): vol.All(
+            vol.Coerce(int), vol.Range(min=100, max=60000)
+        ),
+        vol.Optional(CONF_RETRY_ATTEMPTS, default=DEFAULT_RETRY_ATTEMPTS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10)
+        ),
+        vol.Optional(CONF_RETRY_BACKOFF, default=DEFAULT_RETRY_BACKOFF): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_INTERVALS, default={}): {
+            vol.In(WALLET_SOURCES + MINING_SOURCES): vol.All(vol.Coerce(int), vol.Range(min=1))
+        },
+        vol.Optional(CONF_DEADBAND, default={}): {
+            vol.In(SENSOR_TYPES): {
+                vol.Optional(CONF_DEADBAND_ABSOLUTE): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(CONF_DEADBAND_RELATIVE): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(CONF_DEADBAND_MIN_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=0))
+            }
+        }
     },
     extra=vol.ALLOW_EXTRA
 )
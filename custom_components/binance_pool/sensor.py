@@ -2,14 +2,20 @@
 Binance sensor
 """
 
+import logging
 import re
 
 from datetime import (
     datetime
 )
 
+from time import (
+    monotonic
+)
+
 from homeassistant.const import (
-    ATTR_ATTRIBUTION
+    ATTR_ATTRIBUTION,
+    CONF_NAME
 )
 
 from homeassistant.core import ( 
@@ -24,6 +30,10 @@ from homeassistant.util import (
     slugify
 )
 
+from homeassistant.helpers.event import (
+    async_call_later
+)
+
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity
 )
@@ -50,6 +60,9 @@ from .const import (
     ATTR_WORKER_WORKER,
     ATTR_WORKER_UPDATE,
     
+    ATTR_WORKER_TABLE,
+    ATTR_WORKER_TABLE_TRUNCATED,
+    
     ATTR_STATUS_HRATE15M,
     ATTR_STATUS_HRATE24H,
     ATTR_STATUS_VALID_WORKERS,
@@ -64,120 +77,151 @@ from .const import (
     ATTR_ACCOUNT,
     ATTR_ALGO,
     ATTR_COIN,
+    
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_DEADBAND_MIN_INTERVAL,
+    CONF_MINING,
+    SENSOR_SOURCES,
+    ATTR_DATA_UPDATED,
 
     COORDINATOR_MINING,
-    COORDINATOR_WALLET
+    COORDINATOR_WALLET,
+    
+    WORKER_TABLE_MAX_ROWS
 )
 
+from .models import (
+    WORKER_STATUSES,
+    BalanceRecord,
+    WorkerRecord,
+    BalanceDescriptor,
+    FundingDescriptor,
+    SavingsDescriptor,
+    ExchangeDescriptor,
+    WorkerDescriptor,
+    WorkerTableDescriptor,
+    StatusDescriptor,
+    ProfitDescriptor
+)
+
+from .discovery import (
+    get_sensor_descriptors,
+    require_sensor_data
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+WORKER_ICONS = [ "mdi:sync-off", "mdi:server-network", "mdi:server-network-off", "mdi:power-plug-off" ]
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     entry_id = config_entry.entry_id
-    sensors = hass.data[DOMAIN][entry_id]['sensors']
-    coordinators = hass.data[DOMAIN][entry_id]['coordinator']
+    data = hass.data[DOMAIN][entry_id]
+    sensors = data.pop('sensors', [])
+    config = data['config']
+    coordinators = data['coordinator']
+    wallet = coordinators[COORDINATOR_WALLET]
+    mining = coordinators[COORDINATOR_MINING]
     
-    for sensor_data in sensors:
-        sensor = False
-        
-        if sensor_data is None:
-            continue
-        
-        elif all(i in sensor_data for i in ["name", "coin", "free", "locked", "freeze", "native"]):
-            coordinator = coordinators[COORDINATOR_WALLET]        
-            name = sensor_data["name"]
-            coin = sensor_data["coin"]
-            free = sensor_data["free"]
-            locked = sensor_data["locked"]
-            freeze = sensor_data["freeze"]
-            native = sensor_data["native"]
+    # coordinator contexts of created entities, descriptors are not kept after setup
+    known = set()
+    generations = {}
     
-            sensor = BinanceBalanceSensor(coordinator, name, coin, free, locked, freeze, native)
-            
-        elif all(i in sensor_data for i in ["name", "asset", "free", "locked", "freeze", "withdrawing", "native"]):
-            coordinator = coordinators[COORDINATOR_WALLET]        
-            name = sensor_data["name"]
-            coin = sensor_data["asset"]
-            free = sensor_data["free"]
-            locked = sensor_data["locked"]
-            freeze = sensor_data["freeze"]
-            native = sensor_data["native"]
-            withdrawing = sensor_data["withdrawing"]
-    
-            sensor = BinanceFundingSensor(coordinator, name, coin, free, locked, freeze, withdrawing, native)
+    def create_entities(descriptors):
+        entities = []
+        
+        for descriptor in descriptors:
+            factory = SENSOR_FACTORIES.get(type(descriptor))
             
-        elif all(i in sensor_data for i in ["name", "coin", "total", "fixed", "flexible", "native"]):
-            coordinator = coordinators[COORDINATOR_WALLET]        
-            name = sensor_data["name"]
-            coin = sensor_data["coin"]
-            total = sensor_data["total"]
-            fixed = sensor_data["fixed"]
-            flexible = sensor_data["flexible"]
-            native = sensor_data["native"]
+            if factory:
+                entities.append(factory(coordinators, descriptor))
+                
+        known.update(entity.coordinator_context for entity in entities)
+        
+        return entities
     
-            sensor = BinanceSavingsSensor(coordinator, name, coin, total, fixed, flexible, native)        
+    @callback
+    def async_discover():
+        """Add sensors for coins, symbols and workers that appeared since setup"""
+        
+        if all(generations.get(key) == coordinator.generation for key, coordinator in coordinators.items()):
+            return
+        
+        generations.update({ key: coordinator.generation for key, coordinator in coordinators.items() })
+        
+        new = [ descriptor for descriptor in get_sensor_descriptors(config_entry.data[CONF_NAME], config, wallet, mining) if get_descriptor_context(descriptor) not in known ]
+        if not new:
+            return
+        
+        _LOGGER.debug(f"Adding {len(new)} discovered sensors")
+        
+        require_sensor_data(wallet, new)
+        wallet.update_rates()
+        
+        async_add_entities(create_entities(new), False)
             
-        elif all(i in sensor_data for i in ["name", "symbol", "price"]):
-            coordinator = coordinators[COORDINATOR_WALLET]        
-            name = sensor_data["name"]
-            symbol = sensor_data["symbol"]
-            price = sensor_data["price"]
-    
-            sensor = BinanceExchangeSensor(coordinator, name, symbol, price)
+    generations.update({ key: coordinator.generation for key, coordinator in coordinators.items() })
+    async_add_entities(create_entities(sensors), False)
     
+    config_entry.async_on_unload(wallet.async_add_listener(async_discover))
     
-        elif all(i in sensor_data for i in ["name", "account", "algorithm", "workerName", "status", "hashRate", "dayHashRate", "rejectRate", "lastShareTime"]):
-            coordinator = coordinators[COORDINATOR_MINING]        
-            name = sensor_data["name"]
-            account = sensor_data["account"]
-            algorithm = sensor_data["algorithm"]
-            worker = sensor_data["workerName"]
-            status = sensor_data["status"]
-            hrate = sensor_data["hashRate"]
-            hrate_daily = sensor_data["dayHashRate"]
-            reject = sensor_data["rejectRate"]
-            update = sensor_data["lastShareTime"]
-    
-            sensor = BinanceWorkerSensor(coordinator, name, account, algorithm, worker, status, hrate, hrate_daily, reject, update)
-    
-        elif all(i in sensor_data for i in ["name", "account", "algorithm", "fifteenMinHashRate", "dayHashRate", "validNum", "invalidNum", "unknown", "invalid", "inactive"]):
-            coordinator = coordinators[COORDINATOR_MINING]
-            name = sensor_data["name"]
-            account = sensor_data["account"]
-            algorithm = sensor_data["algorithm"]
-            hrate_15min = sensor_data["fifteenMinHashRate"]
-            hrate_day = sensor_data["dayHashRate"]
-            validNum = sensor_data["validNum"]
-            invalidNum = sensor_data["invalidNum"]
-            unknown = sensor_data["unknown"]
-            invalid = sensor_data["invalid"]
-            inactive = sensor_data["inactive"]
+    if config[CONF_MINING]:
+        config_entry.async_on_unload(mining.async_add_listener(async_discover))
+
+def native_value(value, conversion) -> str:
+    """Value converted with (rate, decimals) of the wallet rate table"""
+    rate, decimals = conversion
     
-            sensor = BinanceStatusSensor(coordinator, name, account, algorithm, hrate_15min, hrate_day, validNum, invalidNum, unknown, invalid, inactive)
-            
-        elif all(i in sensor_data for i in ["name", "account", "algorithm", "coin", "profitToday", "profitYesterday", "native"]):
-            coordinator = coordinators[COORDINATOR_MINING]
-            wallet = coordinators[COORDINATOR_WALLET]
-            name = sensor_data["name"]
-            account = sensor_data["account"]
-            algorithm = sensor_data["algorithm"]
-            coin = sensor_data["coin"]
-            estimate = sensor_data["profitToday"]
-            earnings = sensor_data["profitYesterday"]
-            native = sensor_data["native"]
-            
-            
-            sensor = BinanceProfitSensor(coordinator, wallet, name, account, algorithm, coin, estimate, earnings, native)        
+    return "{:.{}f}".format(float(value) * rate, decimals)
+
+
+def native_attributes(data, kind, coin, natives, rates, amounts):
+    """Add `amounts` of the coin converted to each native currency to the attributes"""
+    conversions = [ (native, rates.get((coin, native.upper()))) for native in natives ]
     
-        if sensor:
-            async_add_entities([sensor], False)
+    for typ, amount in amounts.items():
+        for native, conversion in conversions:
+            if conversion:
+                data[f"Native {typ} {kind} in {native}"] = native_value(amount, conversion)
+
 
 class BinanceSensorEntity(CoordinatorEntity, SensorEntity):
-    def __init__(self, coordinator:CoordinatorEntity, name:str):
-        super().__init__(coordinator = coordinator)
+    """Base of Binance sensors
+    
+        States are written through `_async_write_state`, which drops writes that 
+        change nothing or stay within the deadband of the sensor type, and defers 
+        writes coming sooner than its minimum interval.
+    """
+    
+    def __init__(self, coordinator:CoordinatorEntity, name:str, context:tuple = None):
+        super().__init__(coordinator = coordinator, context = context)
         
         self._name = name
         self._state = None
         
+        deadband = coordinator.deadbands.get(context[0], {}) if context else {}
+        
+        self._deadband_absolute = deadband.get(CONF_DEADBAND_ABSOLUTE, 0)
+        self._deadband_relative = deadband.get(CONF_DEADBAND_RELATIVE, 0)
+        self._min_interval = deadband.get(CONF_DEADBAND_MIN_INTERVAL, 0)
+        
+        self._attributes = None
+        self._attributes_key = None
+        
+        self._written = None
+        self._written_at = 0
+        self._unsub_write = None
+        
+        self._present = True
+        self._source = SENSOR_SOURCES.get(context[0]) if context else None
+        
         
+    @property
+    def available(self) -> bool:
+        """Unavailable also when the data of the sensor vanished from the API answers or expired"""
+        return super().available and self._present and not self.coordinator.is_expired(self._source)
+    
     @property
     def unique_id(self):
         return slugify(text = self._name, separator = '-')
@@ -203,8 +247,23 @@ class BinanceSensorEntity(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self):
+        """Return the state attributes cached by the last update, with the data age while its source fails."""
+        
+        if self._source in self.coordinator.failures and self._source in self.coordinator.updated:
+            return { **(self._attributes or {}), ATTR_DATA_UPDATED: self.coordinator.updated[self._source].isoformat() }
+        
+        return self._attributes
+    
+    def _build_attributes(self):
         raise Exception('Unimplemented')
     
+    def _update_attributes(self, *values):
+        """Rebuild cached attributes only when the values they are made of change"""
+        
+        if self._attributes is None or values != self._attributes_key:
+            self._attributes_key = values
+            self._attributes = self._build_attributes()
+    
     async def async_added_to_hass(self):
         self._handle_coordinator_update()    
         
@@ -213,6 +272,82 @@ class BinanceSensorEntity(CoordinatorEntity, SensorEntity):
                 self._handle_coordinator_update, self.coordinator_context
             )
         )        
+        
+        self.async_on_remove(self._async_cancel_write)
+        
+    @callback
+    def _async_cancel_write(self):
+        if self._unsub_write:
+            self._unsub_write()
+            self._unsub_write = None
+            
+    def _value_changed(self, old, new, absolute = 0) -> bool:
+        if old == new:
+            return False
+        
+        try:
+            old = float(old)
+            new = float(new)
+        except (TypeError, ValueError):
+            return True
+        
+        delta = abs(new - old)
+        
+        if delta <= absolute:
+            return False
+        
+        if self._deadband_relative and old and delta / abs(old) <= self._deadband_relative:
+            return False
+        
+        return True
+    
+    def _attributes_changed(self, old, new) -> bool:
+        """Attributes differ in keys, in non-numeric values or in numeric ones beyond the relative deadband"""
+        
+        if old is new or old == new:
+            return False
+        
+        if old is None or new is None or old.keys() != new.keys():
+            return True
+        
+        return any(self._value_changed(value, new[key]) for key, value in old.items())
+    
+    @callback
+    def _async_write_state(self) -> None:
+        """Write state if it changed meaningfully since the last written one"""
+        
+        written = (self.available, self._state, self.unit_of_measurement, self.icon, self.extra_state_attributes)
+        stats = self.coordinator.write_stats.setdefault(self.coordinator_context[0] if self.coordinator_context else None, { "written": 0, "suppressed": 0 })
+        
+        if self._written is not None:
+            available, state, unit, icon, attributes = self._written
+            
+            if available == written[0] and unit == written[2] and icon == written[3] and not self._attributes_changed(attributes, written[4]) and not self._value_changed(state, written[1], self._deadband_absolute):
+                stats["suppressed"] += 1
+                return
+            
+            wait = self._written_at + self._min_interval - monotonic()
+            
+            if wait > 0 and available == written[0]:
+                stats["suppressed"] += 1
+                
+                if not self._unsub_write:
+                    self._unsub_write = async_call_later(self.hass, wait, self._async_write_deferred)
+                    
+                return
+            
+        self._async_cancel_write()
+        
+        self._written = written
+        self._written_at = monotonic()
+        
+        stats["written"] += 1
+        self.async_write_ha_state()
+        
+    @callback
+    def _async_write_deferred(self, now = None) -> None:
+        self._unsub_write = None
+        self._async_write_state()
     
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -222,20 +357,17 @@ class BinanceSensorEntity(CoordinatorEntity, SensorEntity):
 class BinanceBalanceSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
     
-    def __init__(self, coordinator, name, coin, free, locked, freeze, native = []):
+    def __init__(self, coordinator, name, coin, native = []):
         """Initialize the sensor."""
         self._coin = coin
-        self._free = free
-        self._locked = locked
-        self._freeze = freeze
+        self._balance = BalanceRecord(coin)
         self._native = native
         self._unit_of_measurement = coin
-        self._total = float(free) + float(locked) + float(freeze)
-        self._native_balance = { "total" : {}, "free": {}, "freeze": {}, "locked": {} }
         
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {coin} Balance"
+            name = f"{name} {coin} Balance",
+            context = ("balance", coin)
         )
 
     @property
@@ -249,75 +381,53 @@ class BinanceBalanceSensor(BinanceSensorEntity):
 
         return CURRENCY_ICONS.get(self._coin, "mdi:currency-" + self._coin.lower())
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
+        balance = self._balance
         data = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
-            ATTR_FREE: "{:.8f}".format(float(self._free)),
-            ATTR_LOCKED: "{:.8f}".format(float(self._locked)),
-            ATTR_FREEZE: "{:.8f}".format(float(self._freeze)),            
-            ATTR_TOTAL: "{:.8f}".format(float(self._total)),
+            ATTR_FREE: "{:.8f}".format(balance.free),
+            ATTR_LOCKED: "{:.8f}".format(balance.locked),
+            ATTR_FREEZE: "{:.8f}".format(balance.freeze),            
+            ATTR_TOTAL: "{:.8f}".format(balance.total),
         }
         
-        for typ, native in self._native_balance.items():
-            for asset, exchange in native.items(): 
-                data[f"Native {typ} balance in {asset}"] = exchange
+        native_attributes(data, "balance", self._coin, self._native, self.coordinator.rates, {
+            "total": balance.total,
+            "free": balance.free,
+            "freeze": balance.freeze,
+            "locked": balance.locked
+        })
          
         return data
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        for balance in self.coordinator.balances:
-            if balance["coin"] == self._coin:
-                
-                self._total = float(balance["free"]) + float(balance["locked"]) + float(balance["freeze"])
-                self._free = balance["free"]
-                self._locked = balance["locked"]
-                self._freeze = balance["freeze"]
-                self._state = self._total
-                
-                if self._native:
-                    for native in self._native:
-                        for ticker in self.coordinator.tickers:
-                            if ticker["symbol"] == self._coin + native.upper():
-                                self._native_balance["total"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._total))
-                                self._native_balance["free"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._free))
-                                self._native_balance["locked"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._locked))
-                                self._native_balance["freeze"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._freeze))
-
-                                break
-                            
-                            if ticker["symbol"] == native.upper() + self._coin:      
-                                self._native_balance["total"][native] = "{:.8f}".format(float(self._total) / float(ticker["price"]))
-                                self._native_balance["free"][native] = "{:.8f}".format(float(self._free) / float(ticker["price"]))
-                                self._native_balance["locked"][native] = "{:.8f}".format(float(self._locked) / float(ticker["price"]))
-                                self._native_balance["freeze"][native] = "{:.8f}".format(float(self._freeze) / float(ticker["price"]))                                               
-                            
-                                break
-                break
+        balance = self.coordinator.balances_by_coin.get(self._coin)
+        self._present = balance is not None
+        
+        if balance:
+            self._balance = balance
+            self._state = balance.total
 
-        self.async_write_ha_state()
+        self._update_attributes(self._balance.values(), tuple(self.coordinator.rates.get((self._coin, native.upper())) for native in self._native))
+        self._async_write_state()
         
 class BinanceFundingSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, coordinator, name, coin, free, locked, freeze, withdrawing, native = []):
+    def __init__(self, coordinator, name, coin, native = []):
         """Initialize the sensor."""
         self._coin = coin
-        self._free = free
-        self._locked = locked
-        self._freeze = freeze
-        self._withdrawing = withdrawing
+        self._balance = BalanceRecord(coin)
         self._native = native
         self._unit_of_measurement = coin
-        self._total = float(free) + float(locked) + float(freeze)
-        self._native_balance = { "total" : {}, "free": {}, "freeze": {}, "locked": {}, "withdrawing": {} }
         
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {coin} Funding"
+            name = f"{name} {coin} Funding",
+            context = ("funding", coin)
         )        
 
     @property
@@ -331,22 +441,27 @@ class BinanceFundingSensor(BinanceSensorEntity):
 
         return CURRENCY_ICONS.get(self._coin, "mdi:currency-" + self._coin.lower())
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
+        funding = self._balance
+        total = funding.total + funding.withdrawing
         data = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
-            ATTR_FREE: "{:.8f}".format(float(self._free)),
-            ATTR_LOCKED: "{:.8f}".format(float(self._locked)),
-            ATTR_FREEZE: "{:.8f}".format(float(self._freeze)),    
-            ATTR_WITHDRAW: "{:.8f}".format(float(self._withdrawing)),                    
-            ATTR_TOTAL: "{:.8f}".format(float(self._total)),
+            ATTR_FREE: "{:.8f}".format(funding.free),
+            ATTR_LOCKED: "{:.8f}".format(funding.locked),
+            ATTR_FREEZE: "{:.8f}".format(funding.freeze),    
+            ATTR_WITHDRAW: "{:.8f}".format(funding.withdrawing),                    
+            ATTR_TOTAL: "{:.8f}".format(total),
         }
         
-        for typ, native in self._native_balance.items():
-            for asset, exchange in native.items(): 
-                data[f"Native {typ} funding in {asset}"] = exchange
+        native_attributes(data, "funding", self._coin, self._native, self.coordinator.rates, {
+            "total": total,
+            "free": funding.free,
+            "freeze": funding.freeze,
+            "locked": funding.locked,
+            "withdrawing": funding.withdrawing
+        })
          
         return data
 
@@ -354,69 +469,30 @@ class BinanceFundingSensor(BinanceSensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update current values."""
         
-        fundExists = False
+        funding = self.coordinator.funding_by_asset.get(self._coin)
         
-        for funding in self.coordinator.funding:
-            if funding["asset"] == self._coin:
-                fundExists = True
-                
-                self._total = float(funding["free"]) + float(funding["locked"]) + float(funding["freeze"]) + float(funding["withdrawing"])
-                self._free = funding["free"]
-                self._locked = funding["locked"]
-                self._freeze = funding["freeze"]
-                self._withdrawing = funding["withdrawing"]
-                self._state = self._total
-
-                break
-        
-        if not fundExists:
-            self._total = 0.00
-            self._free = 0.00
-            self._locked = 0.00
-            self._freeze = 0.00
-            self._withdrawing = 0.00
-            self._state = 0.00        
-                
-        if self._native:
-            for native in self._native:
-                for ticker in self.coordinator.tickers:
-            
-                    if ticker["symbol"] == self._coin + native.upper():
-                        self._native_balance["total"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._total))
-                        self._native_balance["free"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._free))
-                        self._native_balance["locked"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._locked))
-                        self._native_balance["freeze"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._freeze))
-                        self._native_balance["withdrawing"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._withdrawing))
-                    
-                        break
-                    
-                    if ticker["symbol"] == native.upper() + self._coin:      
-                        self._native_balance["total"][native] = "{:.8f}".format(float(self._total) / float(ticker["price"]))
-                        self._native_balance["free"][native] = "{:.8f}".format(float(self._free) / float(ticker["price"]))
-                        self._native_balance["locked"][native] = "{:.8f}".format(float(self._locked) / float(ticker["price"]))
-                        self._native_balance["freeze"][native] = "{:.8f}".format(float(self._freeze) / float(ticker["price"]))                                               
-                        self._native_balance["withdrawing"][native] = "{:.8f}".format(float(self._withdrawing) / float(ticker["price"]))
-                    
-                        break
+        self._balance = funding or BalanceRecord(self._coin)
+        self._state = self._balance.total + self._balance.withdrawing
 
-        self.async_write_ha_state()
+        self._update_attributes(self._balance.values(), tuple(self.coordinator.rates.get((self._coin, native.upper())) for native in self._native))
+        self._async_write_state()
         
 class BinanceSavingsSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, coordinator, name, coin, total, fixed, flexible, native = []):
+    def __init__(self, coordinator, name, coin, native = []):
         """Initialize the sensor."""
         self._coin = coin
-        self._total = total
-        self._fixed = fixed
-        self._flexible = flexible
+        self._total = 0
+        self._fixed = 0
+        self._flexible = 0
         self._native = native
         self._unit_of_measurement = coin
-        self._native_balance = { "total" : {}, "fixed": {}, "flexible": {} }
         
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {coin} Savings"
+            name = f"{name} {coin} Savings",
+            context = ("savings", coin)
         )        
         
 
@@ -431,9 +507,8 @@ class BinanceSavingsSensor(BinanceSensorEntity):
 
         return CURRENCY_ICONS.get(self._coin, "mdi:currency-" + self._coin.lower())
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
         data = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
@@ -442,9 +517,11 @@ class BinanceSavingsSensor(BinanceSensorEntity):
             ATTR_TOTAL: "{:.8f}".format(float(self._total)),
         }
         
-        for typ, native in self._native_balance.items():
-            for asset, exchange in native.items(): 
-                data[f"Native {typ} savings in {asset}"] = exchange
+        native_attributes(data, "savings", self._coin, self._native, self.coordinator.rates, {
+            "total": self._total,
+            "fixed": self._fixed,
+            "flexible": self._flexible
+        })
          
         return data
 
@@ -452,43 +529,30 @@ class BinanceSavingsSensor(BinanceSensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update current values."""
         
-        self._total = self.coordinator.savings[f"totalAmountIn{self._coin}"]
-        self._fixed = self.coordinator.savings[f"totalFixedAmountIn{self._coin}"]
-        self._flexible = self.coordinator.savings[f"totalFlexibleIn{self._coin}"]
-        self._state = self._total
-                        
-        if self._native:
-            for native in self._native:
-                for ticker in self.coordinator.tickers:
-            
-                    if ticker["symbol"] == self._coin + native.upper():
-                        self._native_balance["total"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._total))
-                        self._native_balance["fixed"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._fixed))
-                        self._native_balance["flexible"][native] = "{:.2f}".format(float(ticker["price"]) * float(self._flexible))
-                    
-                        break
-                    
-                    if ticker["symbol"] == native.upper() + self._coin:      
-                        self._native_balance["total"][native] = "{:.8f}".format(float(self._total) / float(ticker["price"]))
-                        self._native_balance["fixed"][native] = "{:.8f}".format(float(self._fixed) / float(ticker["price"]))
-                        self._native_balance["flexible"][native] = "{:.8f}".format(float(self._flexible) / float(ticker["price"]))
-                    
-                        break
+        savings = self.coordinator.savings
+        self._present = f"totalAmountIn{self._coin}" in savings
+        
+        if self._present:
+            self._total = savings.get(f"totalAmountIn{self._coin}", 0)
+            self._fixed = savings.get(f"totalLockedIn{self._coin}", 0)
+            self._flexible = savings.get(f"totalFlexibleAmountIn{self._coin}", 0)
+            self._state = self._total
 
-        self.async_write_ha_state()
+        self._update_attributes(self._total, self._fixed, self._flexible, tuple(self.coordinator.rates.get((self._coin, native.upper())) for native in self._native))
+        self._async_write_state()
 
 class BinanceExchangeSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, coordinator, name, symbol, price):
+    def __init__(self, coordinator, name, symbol):
         """Initialize the sensor."""
         self._symbol = symbol
-        self._price = price
         self._unit_of_measurement = None
 
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {symbol} Exchange"
+            name = f"{name} {symbol} Exchange",
+            context = ("exchange", symbol)
         )
 
     @property
@@ -501,9 +565,8 @@ class BinanceExchangeSensor(BinanceSensorEntity):
         """Icon to use in the frontend, if any."""
         return EXCHANGES_ICON
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
         return {
             ATTR_ATTRIBUTION: ATTRIBUTION,
@@ -513,54 +576,34 @@ class BinanceExchangeSensor(BinanceSensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update current values."""
         
-        symbols = {}
-        for coin1 in self.coordinator.balances:
-            for coin2 in self.coordinator.balances:
-                if coin1["coin"] == coin2["coin"]: 
-                    continue
-                    
-                symbol = "{}{}".format(coin1["coin"], coin2["coin"]).upper()
-                
-                if symbol not in symbols:
-                    symbols[symbol] = coin2["coin"]
-                
-                
-        for ticker in self.coordinator.tickers:
-            if ticker["symbol"] == self._symbol:
-                self._state = float(ticker["price"])
-                
-                symbol = ticker["symbol"].upper()
-                if symbol in symbols:
-                    self._unit_of_measurement = symbols[symbol]
-
-                break
-
+        self._present = self._symbol in self.coordinator.prices
+        
+        if self._present:
+            self._state = self.coordinator.prices[self._symbol]
+            
+        if self._symbol in self.coordinator.symbols:
+            self._unit_of_measurement = self.coordinator.symbols[self._symbol][1]
    
-        self.async_write_ha_state()
+        self._update_attributes()
+        self._async_write_state()
         
 class BinanceWorkerSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, coordinator, name, account, algorithm, worker, status, hrate, hrate_daily, reject, update):
+    def __init__(self, coordinator, name, account, algorithm, worker):
         """Initialize the sensor."""
         self._account = account
         self._algorithm = algorithm
         self._worker = worker
-        self._status = status
-        self._hrate = hrate
-        self._hrate_daily = hrate_daily
-        self._reject = reject
-        self._update = update
+        self._record = WorkerRecord(worker)
         self._unit_of_measurement = "H/s"        
         
-        self._status_vars = ["unknown", "valid", "invalid", "inactive"]
-        self._status_icons = ["mdi:sync-off", "mdi:server-network", "mdi:server-network-off", "mdi:power-plug-off"]
-        
         algo = re.sub('-.*$', '', algorithm)
         
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {account}.{worker} ({algo}) worker"
+            name = f"{name} {account}.{worker} ({algo}) worker",
+            context = ("worker", account, algorithm, worker)
         )        
 
     @property
@@ -572,30 +615,86 @@ class BinanceWorkerSensor(BinanceSensorEntity):
     def icon(self):
         """Icon to use in the frontend, if any."""
         
-        try:
-            return self._status_icons[self._status]
-        except KeyError:
-            return self._status_icons[0]
+        status = self._record.status
+        
+        return WORKER_ICONS[status] if 0 <= status < len(WORKER_ICONS) else WORKER_ICONS[0]
+
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
+
+        record = self._record
+        
+        return {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            ATTR_WORKER_HRATE: f"{record.hashrate}",
+            ATTR_WORKER_HRATE_DAILY: f"{record.day_hashrate}",
+            ATTR_WORKER_REJECT: f"{record.reject}",
+            ATTR_WORKER_WORKER: f"{self._worker}",
+            ATTR_WORKER_UPDATE: datetime.fromtimestamp(record.last_share / 1000).strftime("%Y-%m-%d %H:%M:%S"),
+            ATTR_ACCOUNT: f"{self._account}",
+            ATTR_ALGO: f"{self._algorithm}",
+            ATTR_WORKER_STATUS: WORKER_STATUSES[record.status] if 0 <= record.status < len(WORKER_STATUSES) else WORKER_STATUSES[0]
+        }
+        
+    @callback        
+    def _handle_coordinator_update(self) -> None:
+        """Update current values."""
+
+        worker = self.coordinator.workers.get((self._account, self._algorithm, self._worker))
+        self._present = worker is not None
+        
+        if worker:
+            self._record = worker
+            self._state = worker.hashrate
+                            
+        else:
+            self._state = None 
+          
+        self._update_attributes(self._record.values())
+        self._async_write_state()          
+            
+class BinanceWorkerTableSensor(BinanceSensorEntity):
+    """Representation of a Sensor."""
+
+    def __init__(self, coordinator, name, account, algorithm):
+        """Initialize the sensor."""
+        self._account = account
+        self._algorithm = algorithm
+        self._table = None
+        self._unit_of_measurement = "H/s"        
+        
+        algo = re.sub('-.*$', '', algorithm)
+        
+        super().__init__(
+            coordinator = coordinator, 
+            name = f"{name} {account} ({algo}) workers",
+            context = ("worker_table", account, algorithm)
+        )        
 
     @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def unit_of_measurement(self):
+        """Return the unit of measurement this sensor expresses itself in."""
+        return self._unit_of_measurement
+
+    @property
+    def icon(self):
+        """Icon to use in the frontend, if any."""
+        return STATUS_ICON
+
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
         data = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
-            ATTR_WORKER_HRATE: f"{self._hrate}",
-            ATTR_WORKER_HRATE_DAILY: f"{self._hrate_daily}",
-            ATTR_WORKER_REJECT: f"{self._reject}",
-            ATTR_WORKER_WORKER: f"{self._worker}",
-            ATTR_WORKER_UPDATE: datetime.fromtimestamp(self._update / 1000).strftime("%Y-%m-%d %H:%M:%S"),
             ATTR_ACCOUNT: f"{self._account}",
             ATTR_ALGO: f"{self._algorithm}",
         }
         
-        try:
-            data[ATTR_WORKER_STATUS] = self._status_vars[self._status]
-        except KeyError:
-            data[ATTR_WORKER_STATUS] = "unknown"
+        if self._table is not None:
+            data.update(self._table.summary())
+            
+            data[ATTR_WORKER_TABLE] = self._table.columns(WORKER_TABLE_MAX_ROWS)
+            data[ATTR_WORKER_TABLE_TRUNCATED] = max(len(self._table) - WORKER_TABLE_MAX_ROWS, 0)
         
         return data
         
@@ -603,65 +702,39 @@ class BinanceWorkerSensor(BinanceSensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update current values."""
 
-        exists = False
-                
-        for account, algos in self.coordinator.mining.items():
-            if account != self._account:
-                continue
-                
-            for algo, typ in algos.items():
-                if algo != self._algorithm or "workers" not in typ:
-                    continue
-                
-                for worker in typ["workers"]:
-                    if worker["workerName"] != self._worker:
-                        continue
-                    
-                    exists = True
-                        
-                    self._status = worker["status"]
-                    self._hrate = worker["hashRate"]
-                    self._hrate_daily = worker["dayHashRate"]
-                    self._reject = worker["rejectRate"]
-                    self._update = worker["lastShareTime"]
-
-                    self._state = self._hrate
-    
-                    break                
-                if exists:
-                    break
+        self._table = self.coordinator.tables.get((self._account, self._algorithm))
+        self._present = self._table is not None
         
-            if exists:
-                break
-                            
-        if not exists:
+        if self._table is not None:
+            self._state = sum(self._table.hashrate)
+        else:
             self._state = None 
           
-        self.async_write_ha_state()          
+        self._update_attributes(self._table.fingerprint() if self._table is not None else None)
+        self._async_write_state()          
             
 class BinanceStatusSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, coordinator, name, account, algorithm, hrate_15min, hrate_day, validNum, invalidNum, unknown, invalid, inactive):
+    def __init__(self, coordinator, name, account, algorithm):
         """Initialize the sensor."""
         self._account = account
         self._algorithm = algorithm
-        self._hrate15m = hrate_15min
-        self._hrate24h = hrate_day
-        self._valid_workers = validNum
-        self._total_alerts = invalidNum
-        self._unknown_workers = unknown
-        self._invalid_workers = invalid
-        self._inactive_workers = inactive
+        self._hrate15m = 0
+        self._hrate24h = 0
+        self._valid_workers = 0
+        self._total_alerts = 0
+        self._unknown_workers = 0
+        self._invalid_workers = 0
+        self._inactive_workers = 0
         self._unit_of_measurement = "H/s"        
-
-        self._status_vars = ["unknown", "valid", "invalid", "inactive"]
         
         algo = re.sub('-.*$', '', algorithm)
         
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {account} ({algo}) status"
+            name = f"{name} {account} ({algo}) status",
+            context = ("status", account, algorithm)
         )        
 
     @property
@@ -674,9 +747,8 @@ class BinanceStatusSensor(BinanceSensorEntity):
         """Icon to use in the frontend, if any."""
         return STATUS_ICON
     
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
         return {
             ATTR_ATTRIBUTION: ATTRIBUTION,
@@ -694,61 +766,38 @@ class BinanceStatusSensor(BinanceSensorEntity):
     @callback        
     def _handle_coordinator_update(self) -> None:
         """Update current values."""
-        exists = False
-
-        for account, algos in self.coordinator.mining.items():
-            if account != self._account:
-                continue
-                
-            for algo, typ in algos.items():
-                if algo != self._algorithm or "status" not in typ:
-                    continue
-
-                exists = True
-                
-                self._hrate15m = typ["status"].get("fifteenMinHashRate", 0)
-                self._hrate24h = typ["status"].get("dayHashRate", 0)
-                self._valid_workers = typ["status"]["validNum"]
-                self._total_alerts = typ["status"]["invalidNum"]
-                
-                self._state = self._hrate15m
-                
-                unknown = invalid = inactive = 0 
-                
-                if "workers" in typ:
-                    for worker in typ["workers"]:
-                        if worker["status"] == 0:
-                            unknown += 1
-                        elif worker["status"] == 2:
-                            invalid += 1
-                        elif worker["status"] == 3:
-                            inactive += 1
-
-                    self._unknown_workers = unknown
-                    self._invalid_workers = invalid
-                    self._inactive_workers = inactive
-
-                break
+        key = (self._account, self._algorithm)
+        status = self.coordinator.statuses.get(key)
+        self._present = status is not None
+
+        if status:
+            self._hrate15m = status.get("fifteenMinHashRate", 0)
+            self._hrate24h = status.get("dayHashRate", 0)
+            self._valid_workers = status["validNum"]
+            self._total_alerts = status["invalidNum"]
+            
+            self._state = self._hrate15m
             
-            if exists:
-                break
+            if key in self.coordinator.worker_counts:
+                self._unknown_workers, self._invalid_workers, self._inactive_workers = self.coordinator.worker_counts[key]
                 
-        if not exists:
+        else:
             self._state = 0
           
           
-        self.async_write_ha_state()
+        self._update_attributes(self._hrate15m, self._hrate24h, self._valid_workers, self._total_alerts, self._unknown_workers, self._invalid_workers, self._inactive_workers)
+        self._async_write_state()
                     
 class BinanceProfitSensor(BinanceSensorEntity):
     """Representation of a Sensor."""
 
-    def __init__(self, coordinator, wallet, name, account, algorithm, coin, estimate, earnings, native = []):
+    def __init__(self, coordinator, wallet, name, account, algorithm, coin, native = []):
         """Initialize the sensor."""
         self._account = account
         self._algorithm = algorithm
         self._coin = coin
-        self._estimate = estimate
-        self._earnings = earnings
+        self._estimate = 0
+        self._earnings = 0
         self._unit_of_measurement = f"{coin}"        
         self._native = native
         self._native_earnings = {}
@@ -759,7 +808,8 @@ class BinanceProfitSensor(BinanceSensorEntity):
         
         super().__init__(
             coordinator = coordinator, 
-            name = f"{name} {account} ({algo}) {coin} profit"
+            name = f"{name} {account} ({algo}) {coin} profit",
+            context = ("profit", account, algorithm, coin)
         )        
         
     @property
@@ -772,9 +822,8 @@ class BinanceProfitSensor(BinanceSensorEntity):
         """Icon to use in the frontend, if any."""
         return CURRENCY_ICONS.get(self._coin, "mdi:currency-" + self._coin.lower())
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes of the sensor."""
+    def _build_attributes(self):
+        """Build the state attributes of the sensor."""
 
         data = {
             ATTR_ATTRIBUTION: ATTRIBUTION,
@@ -799,90 +848,80 @@ class BinanceProfitSensor(BinanceSensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Update current values."""
 
-        exists = False
-                
-        for account, algos in self.coordinator.mining.items():
-            if account != self._account:
-                continue
-                
-            for algo, typ in algos.items():
-                if algo != self._algorithm or "status" not in typ:
-                    continue
+        status = self.coordinator.statuses.get((self._account, self._algorithm))
+        
+        self._present = bool(status) and self._coin in self.coordinator.algo_coins.get(self._algorithm, ())
+        
+        if self._present:
+            coin = self._coin
+            
+            estimate = status.get("profitToday", {})
+            earnings = status.get("profitYesterday", {})
+
+            old_estimate = self._estimate
+            old_earnings = self._earnings
+            new_estimate = 0.00
+            new_earnings = 0.00
+                                    
+            if coin in estimate:
+                new_estimate = estimate[coin]
+            else:
+                new_estimate = 0.00
+
+            if coin in earnings:
+                new_earnings = earnings[coin]   
+            
+            elif float(old_earnings) > 0: 
+                new_earnings = old_earnings
                 
+                if float(old_estimate) > 0 and float(new_estimate) == 0:
+                    new_earnings = old_estimate
                 
-                for coindata in self.coordinator.coins:
-                    coin = coindata["coinName"]
-                    
-                    if coin != self._coin:
+            else:
+                new_earnings = 0.00
+               
+
+            self._estimate = new_estimate
+            self._earnings = new_earnings
+            self._state = float(self._earnings)
+
+            if self._native:
+                for native in self._native: 
+                    conversion = self._wallet.rates.get((self._coin, native.upper()))
+                    if not conversion:
                         continue
-
-                    estimate = typ["status"].get("profitToday", {})
-                    earnings = typ["status"].get("profitYesterday", {})
-
-                    old_estimate = self._estimate
-                    old_earnings = self._earnings
-                    new_estimate = 0.00
-                    new_earnings = 0.00
-                                            
-                    exists = True
-                                            
-                    if coin in estimate:
-                        new_estimate = estimate[coin]
-                    else:
-                        new_estimate = 0.00
-
-                    if coin in earnings:
-                        new_earnings = earnings[coin]   
                     
-                    elif float(old_earnings) > 0: 
-                        new_earnings = old_earnings
-                        
-                        if float(old_estimate) > 0 and float(new_estimate) == 0:
-                            new_earnings = old_estimate
-                        
-                    else:
-                        new_earnings = 0.00
-                       
-
-                    self._estimate = new_estimate
-                    self._earnings = new_earnings
-                    self._state = float(self._earnings)
-
-                    if self._native:
-                        for native in self._native: 
-                            for ticker in self._wallet.tickers:
-                                if ticker["symbol"] == self._coin + native.upper():
-                                    self._native_estimate[native] = float("{:.8f}".format(float(ticker["price"]) * float(self._estimate)))
-                            
-                                    break
-                                
-                                if ticker["symbol"] == native.upper() + self._coin:      
-                                    self._native_estimate[native] = "{:.8f}".format(float(self._estimate) / float(ticker["price"]))
-                            
-                                    break 
-
-                    if self._native:
-                        for native in self._native: 
-                            for ticker in self._wallet.tickers:
-                                if ticker["symbol"] == self._coin + native.upper():
-                                    self._native_earnings[native] = "{:.8f}".format(float(ticker["price"]) * float(self._earnings))
-                            
-                                    break
-                                
-                                if ticker["symbol"] == native.upper() + self._coin:      
-                                    self._native_earnings[native] = "{:.8f}".format(float(self._earnings) / float(ticker["price"]))
-                            
-                                    break 
-
-                    break   
-                
-                if exists:
-                    break
-        
-            if exists:
-                break
+                    self._native_estimate[native] = native_value(self._estimate, (conversion[0], 8))
+                    self._native_earnings[native] = native_value(self._earnings, (conversion[0], 8))
                             
-        if not exists:
+        else:
             self._state = None   
             
-        self.async_write_ha_state()
\ No newline at end of file
+        self._update_attributes(self._estimate, self._earnings, tuple(self._wallet.rates.get((self._coin, native.upper())) for native in self._native))
+        self._async_write_state()
+
+SENSOR_FACTORIES = {
+    BalanceDescriptor: lambda coordinators, d: BinanceBalanceSensor(coordinators[COORDINATOR_WALLET], d.name, d.coin, d.native),
+    FundingDescriptor: lambda coordinators, d: BinanceFundingSensor(coordinators[COORDINATOR_WALLET], d.name, d.coin, d.native),
+    SavingsDescriptor: lambda coordinators, d: BinanceSavingsSensor(coordinators[COORDINATOR_WALLET], d.name, d.coin, d.native),
+    ExchangeDescriptor: lambda coordinators, d: BinanceExchangeSensor(coordinators[COORDINATOR_WALLET], d.name, d.symbol),
+    WorkerDescriptor: lambda coordinators, d: BinanceWorkerSensor(coordinators[COORDINATOR_MINING], d.name, d.account, d.algorithm, d.worker),
+    WorkerTableDescriptor: lambda coordinators, d: BinanceWorkerTableSensor(coordinators[COORDINATOR_MINING], d.name, d.account, d.algorithm),
+    StatusDescriptor: lambda coordinators, d: BinanceStatusSensor(coordinators[COORDINATOR_MINING], d.name, d.account, d.algorithm),
+    ProfitDescriptor: lambda coordinators, d: BinanceProfitSensor(coordinators[COORDINATOR_MINING], coordinators[COORDINATOR_WALLET], d.name, d.account, d.algorithm, d.coin, d.native)
+}
+
+SENSOR_CONTEXTS = {
+    BalanceDescriptor: "balance",
+    FundingDescriptor: "funding",
+    SavingsDescriptor: "savings",
+    ExchangeDescriptor: "exchange",
+    WorkerDescriptor: "worker",
+    WorkerTableDescriptor: "worker_table",
+    StatusDescriptor: "status",
+    ProfitDescriptor: "profit"
+}
+
+def get_descriptor_context(descriptor) -> tuple:
+    """Coordinator context of the entity created from the descriptor"""
+    return (SENSOR_CONTEXTS[type(descriptor)], *(value for field, value in zip(descriptor._fields, descriptor) if field not in ("name", "native")))
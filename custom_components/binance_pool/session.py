@@ -0,0 +1,182 @@
+"""
+Shared HTTP connection pool for Binance API clients
+"""
+
+import logging
+
+from asyncio import (
+    Lock
+)
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector
+)
+
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE
+)
+
+from homeassistant.core import (
+    callback
+)
+
+from homeassistant.helpers.storage import (
+    Store
+)
+
+from .const import (
+    DOMAIN,
+    DATA_CONNECTIONS,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    CONNECTION_DNS_CACHE_TTL,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    API_IP_WEIGHT_LIMIT,
+    SAPI_IP_WEIGHT_LIMIT,
+    SAPI_UID_WEIGHT_LIMIT,
+    CACHE_STORAGE_KEY,
+    CACHE_STORAGE_VERSION,
+    CACHE_SAVE_DELAY
+)
+
+from .cache import (
+    BinanceResponseCache
+)
+
+from .retry import (
+    BinanceCircuitBreaker
+)
+
+from .ratelimit import (
+    BinanceWeightLimiter
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BinanceConnection:
+    """Keep-alive session, IP weight limits and public answers cache shared by all clients of one Binance domain"""
+
+    def __init__(self, tld):
+        """Initialize."""
+        self.tld = tld
+        self.session = None
+        self.limiters = {
+            'api': BinanceWeightLimiter(f"binance.{tld} api IP", API_IP_WEIGHT_LIMIT),
+            'sapi': BinanceWeightLimiter(f"binance.{tld} sapi IP", SAPI_IP_WEIGHT_LIMIT)
+        }
+        self.uid_limiters = {}
+        self.cache = BinanceResponseCache()
+        self.inflight = {}
+        self.coalesced = 0
+        self.breakers = {}
+        self.time_offset = 0
+        self.time_synced_at = None
+        self.time_lock = Lock()
+
+    def get_breaker(self, path) -> BinanceCircuitBreaker:
+        if path not in self.breakers:
+            self.breakers[path] = BinanceCircuitBreaker(f"binance.{self.tld} {path}")
+
+        return self.breakers[path]
+
+    def get_uid_limiter(self, api_key) -> BinanceWeightLimiter:
+        if api_key not in self.uid_limiters:
+            self.uid_limiters[api_key] = BinanceWeightLimiter(f"binance.{self.tld} sapi UID", SAPI_UID_WEIGHT_LIMIT)
+
+        return self.uid_limiters[api_key]
+
+    def get_session(self) -> ClientSession:
+        if not self.session or self.session.closed:
+            _LOGGER.debug(f"Open shared session for binance.{self.tld}")
+
+            self.session = ClientSession(
+                connector=TCPConnector(
+                    limit=CONNECTION_LIMIT,
+                    limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                    ttl_dns_cache=CONNECTION_DNS_CACHE_TTL,
+                    keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+                    enable_cleanup_closed=True
+                )
+            )
+
+        return self.session
+
+    async def async_close(self):
+        self.cache.cancel()
+
+        if self.session and not self.session.closed:
+            _LOGGER.debug(f"Close shared session for binance.{self.tld}")
+            await self.session.close()
+
+        self.session = None
+
+
+class BinanceConnectionManager:
+    """Connections by Binance domain, alive while any config entry uses them
+
+        Cached answers of all connections are persisted, so they survive restarts.
+    """
+
+    def __init__(self, hass):
+        """Initialize."""
+        self.hass = hass
+        self.connections = {}
+        self.entries = set()
+        self.store = Store(hass, CACHE_STORAGE_VERSION, CACHE_STORAGE_KEY)
+        self.loaded = False
+
+    def get(self, tld) -> BinanceConnection:
+        if tld not in self.connections:
+            connection = self.connections[tld] = BinanceConnection(tld)
+            connection.cache.on_change = self._async_schedule_save
+
+        return self.connections[tld]
+
+    async def async_load(self):
+        if self.loaded:
+            return
+
+        self.loaded = True
+
+        data = await self.store.async_load() or {}
+        for tld, entries in data.items():
+            self.get(tld).cache.restore(entries)
+
+    @callback
+    def _async_schedule_save(self):
+        self.store.async_delay_save(self._data_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self):
+        return { tld: connection.cache.dump() for tld, connection in self.connections.items() }
+
+    def acquire(self, entry_id):
+        self.entries.add(entry_id)
+
+    async def async_release(self, entry_id):
+        self.entries.discard(entry_id)
+
+        if not self.entries:
+            await self.async_close()
+
+    async def async_close(self, *args):
+        for connection in self.connections.values():
+            await connection.async_close()
+
+
+@callback
+def async_get_connection_manager(hass) -> BinanceConnectionManager:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    if DATA_CONNECTIONS not in domain_data:
+        manager = domain_data[DATA_CONNECTIONS] = BinanceConnectionManager(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, manager.async_close)
+
+    return domain_data[DATA_CONNECTIONS]
+
+
+@callback
+def async_get_connection(hass, tld) -> BinanceConnection:
+    return async_get_connection_manager(hass).get(tld)
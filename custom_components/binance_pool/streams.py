@@ -0,0 +1,269 @@
+"""
+Binance WebSocket streams
+"""
+
+import logging
+
+from datetime import (
+    timedelta
+)
+
+from asyncio import (
+    CancelledError,
+    TimeoutError,
+    sleep
+)
+
+from aiohttp import (
+    ClientError,
+    WSMsgType
+)
+
+from homeassistant.core import (
+    callback
+)
+
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_interval
+)
+
+from .const import (
+    MARKET_STREAM_URL,
+    MARKET_STREAM_MINI_TICKER,
+    USER_STREAM_URL,
+    USER_STREAM_KEEPALIVE_INTERVAL,
+    STREAM_HEARTBEAT,
+    STREAM_RECONNECT_MAX_DELAY,
+    DEFAULT_MARKET_STREAM_INTERVAL
+)
+
+from .client import (
+    BinanceAPIException,
+    BinanceRequestException
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BinanceStream:
+    """Reconnecting WebSocket connection of a coordinator"""
+
+    def __init__(self, hass, coordinator, url):
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.url = url
+        self.connected = False
+        self.messages = 0
+
+        self._task = None
+        self._ws = None
+
+    @callback
+    def async_start(self):
+        if not self._task:
+            self._task = self.hass.loop.create_task(self._async_run())
+
+    async def async_stop(self):
+        if self._task:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except CancelledError:
+                pass
+
+            self._task = None
+
+    async def _async_get_url(self) -> str:
+        raise Exception('Unimplemented')
+
+    @callback
+    def _handle_message(self, message):
+        raise Exception('Unimplemented')
+
+    async def _async_run(self):
+        delay = 1
+
+        while True:
+            try:
+                url = await self._async_get_url()
+                session = self.coordinator.client.connection.get_session()
+
+                async with session.ws_connect(url, heartbeat=STREAM_HEARTBEAT) as ws:
+                    _LOGGER.debug(f"Stream connected to {self.url}")
+
+                    self.connected = True
+                    self._ws = ws
+                    delay = 1
+
+                    async for msg in ws:
+                        if msg.type == WSMsgType.TEXT:
+                            self.messages += 1
+                            self._handle_message(msg.json())
+
+                        elif msg.type in (WSMsgType.CLOSED, WSMsgType.ERROR):
+                            break
+
+            except (ClientError, TimeoutError, ValueError, BinanceAPIException, BinanceRequestException) as e:
+                _LOGGER.warning(f"Stream {self.url} failed: {e}")
+
+            finally:
+                self.connected = False
+                self._ws = None
+
+            _LOGGER.debug(f"Stream {self.url} reconnects in {delay}s")
+
+            await sleep(delay)
+            delay = min(delay * 2, STREAM_RECONNECT_MAX_DELAY)
+
+
+class BinanceMarketStream(BinanceStream):
+    """Combined @miniTicker / @bookTicker stream feeding the wallet coordinator prices
+
+        Prices are collected and passed to the coordinator at most once per `interval`
+        seconds. `url` may point to any server speaking the Binance combined stream format.
+        Streams follow the symbols required by the coordinator with SUBSCRIBE / UNSUBSCRIBE
+        requests on the open connection.
+    """
+
+    def __init__(self, hass, coordinator, stream = MARKET_STREAM_MINI_TICKER, interval = DEFAULT_MARKET_STREAM_INTERVAL, url = None):
+        """Initialize."""
+        super().__init__(hass, coordinator, url or MARKET_STREAM_URL.format(coordinator.tld))
+
+        self.stream = stream
+        self.interval = interval
+        self.streams = []
+
+        self._pending = {}
+        self._request_id = 0
+        self._unsub_flush = None
+
+    async def async_stop(self):
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        await super().async_stop()
+
+    def _get_streams(self):
+        symbols = self.coordinator.get_ticker_symbols()
+
+        if not symbols:
+            return [ f"!{MARKET_STREAM_MINI_TICKER}@arr" ]
+
+        return [ f"{symbol.lower()}@{self.stream}" for symbol in symbols ]
+
+    async def _async_get_url(self) -> str:
+        self.streams = self._get_streams()
+
+        return f"{self.url}?streams=" + '/'.join(self.streams)
+
+    async def _async_resubscribe(self):
+        """Change streams of the open connection to the symbols required now"""
+
+        streams = self._get_streams()
+        ws = self._ws
+
+        if ws is None or ws.closed or streams == self.streams:
+            return
+
+        added = [ stream for stream in streams if stream not in self.streams ]
+        removed = [ stream for stream in self.streams if stream not in streams ]
+
+        try:
+            for method, params in (("SUBSCRIBE", added), ("UNSUBSCRIBE", removed)):
+                if params:
+                    self._request_id += 1
+                    await ws.send_json({ "method": method, "params": params, "id": self._request_id })
+
+            self.streams = streams
+            _LOGGER.debug(f"Stream {self.url} resubscribed: +{len(added)} -{len(removed)}")
+
+        except (ClientError, ConnectionError) as e:
+            _LOGGER.debug(f"Stream {self.url} not resubscribed: {e}")
+
+    @callback
+    def _handle_message(self, message):
+        data = message.get("data", message) if isinstance(message, dict) else message
+
+        for ticker in data if isinstance(data, list) else [data]:
+            symbol = ticker.get("s")
+
+            if "c" in ticker:
+                price = ticker["c"]
+
+            elif "b" in ticker and "a" in ticker:
+                price = "{:.8f}".format((float(ticker["b"]) + float(ticker["a"])) / 2)
+
+            else:
+                continue
+
+            self._pending[symbol] = price
+
+        if self._pending and not self._unsub_flush:
+            self._unsub_flush = async_call_later(self.hass, self.interval, self._async_flush)
+
+    @callback
+    def _async_flush(self, now = None):
+        self._unsub_flush = None
+
+        prices, self._pending = self._pending, {}
+        self.coordinator.async_set_prices(prices)
+
+        self.hass.async_create_task(self._async_resubscribe())
+
+
+class BinanceUserStream(BinanceStream):
+    """User data stream applying balance events to the wallet coordinator
+
+        The listen key is created on connect, kept alive while the stream runs
+        and closed when it stops.
+    """
+
+    def __init__(self, hass, coordinator, url = None):
+        """Initialize."""
+        super().__init__(hass, coordinator, url or USER_STREAM_URL.format(coordinator.tld))
+
+        self.listen_key = None
+        self._unsub_keepalive = None
+
+    async def async_stop(self):
+        if self._unsub_keepalive:
+            self._unsub_keepalive()
+            self._unsub_keepalive = None
+
+        await super().async_stop()
+
+        if self.listen_key:
+            try:
+                await self.coordinator.client.async_close_listen_key(self.listen_key)
+            except (ClientError, TimeoutError, BinanceAPIException, BinanceRequestException) as e:
+                _LOGGER.debug(f"Listen key not closed: {e}")
+
+            self.listen_key = None
+
+    async def _async_get_url(self) -> str:
+        self.listen_key = await self.coordinator.client.async_get_listen_key()
+
+        if not self._unsub_keepalive:
+            self._unsub_keepalive = async_track_time_interval(self.hass, self._async_keepalive, timedelta(minutes=USER_STREAM_KEEPALIVE_INTERVAL))
+
+        return f"{self.url}/{self.listen_key}"
+
+    async def _async_keepalive(self, now = None):
+        if not self.listen_key:
+            return
+
+        try:
+            await self.coordinator.client.async_keepalive_listen_key(self.listen_key)
+            _LOGGER.debug("Listen key kept alive")
+
+        except (ClientError, TimeoutError, BinanceAPIException, BinanceRequestException) as e:
+            _LOGGER.warning(f"Listen key keepalive failed: {e}")
+
+    @callback
+    def _handle_message(self, message):
+        if message.get("e") == "outboundAccountPosition":
+            self.coordinator.async_apply_balance_event(message)
@@ -0,0 +1,71 @@
+"""
+Import time and max RSS of python-binance AsyncClient versus the built-in api.py
+
+Each variant is imported in a fresh interpreter, after aiohttp and yarl which
+both of them use. python-binance has to be installed to measure it:
+
+    pip install python-binance aiohttp yarl
+    python scripts/bench_import.py [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+API_PATH = os.path.join(os.path.dirname(__file__), '..', 'custom_components', 'binance_pool', 'api.py')
+
+PROBE = """
+import importlib.util, json, resource, sys, time
+import aiohttp, yarl
+
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+modules = len(sys.modules)
+started = time.perf_counter()
+
+if sys.argv[1] == 'python-binance':
+    from binance.async_client import AsyncClient
+    from binance.exceptions import BinanceAPIException, BinanceRequestException
+else:
+    spec = importlib.util.spec_from_file_location('api', sys.argv[2])
+    spec.loader.exec_module(importlib.util.module_from_spec(spec))
+
+elapsed = time.perf_counter() - started
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print(json.dumps({ 'time': elapsed * 1000, 'rss': (after - before) / 1024, 'modules': len(sys.modules) - modules }))
+"""
+
+
+def measure(variant, runs):
+    results = []
+
+    for _ in range(runs):
+        answer = subprocess.run([ sys.executable, '-c', PROBE, variant, API_PATH ], capture_output=True, text=True)
+
+        if answer.returncode:
+            print(f"{variant}: {answer.stderr.strip().splitlines()[-1]}")
+            return
+
+        results.append(json.loads(answer.stdout))
+
+    print(
+        f"{variant:15} "
+        f"import {statistics.median(r['time'] for r in results):8.1f} ms  "
+        f"max RSS +{statistics.median(r['rss'] for r in results):6.1f} MiB  "
+        f"modules +{results[0]['modules']}"
+    )
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"median of {runs} runs, ru_maxrss in KiB as on Linux")
+
+    for variant in ('python-binance', 'api.py'):
+        measure(variant, runs)
+
+
+if __name__ == '__main__':
+    main()
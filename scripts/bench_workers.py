@@ -0,0 +1,71 @@
+"""
+Memory of mining workers kept as API dicts versus WorkerRecord items and WorkerTable
+
+Workers are decoded from a synthetic mining/worker/list answer, as the
+coordinator receives them. Retained memory and the tracemalloc peak are
+reported per representation:
+
+    python scripts/bench_workers.py [workers]
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import sys
+import tracemalloc
+
+MODELS_PATH = os.path.join(os.path.dirname(__file__), '..', 'custom_components', 'binance_pool', 'models.py')
+
+
+def load_models():
+    spec = importlib.util.spec_from_file_location('models', MODELS_PATH)
+    models = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(models)
+
+    return models
+
+
+def get_answer(count):
+    return json.dumps([
+        {
+            "workerId": str(1000000 + i),
+            "workerName": f"rig{i:05d}",
+            "status": 1 if i % 10 else 3,
+            "hashRate": 100000000000 + i * 1000,
+            "dayHashRate": 99000000000 + i * 1000,
+            "rejectRate": 0.0 if i % 7 else 0.01,
+            "lastShareTime": 1700000000000 + i
+        }
+        for i in range(count)
+    ])
+
+
+def measure(name, build, count):
+    gc.collect()
+    tracemalloc.start()
+
+    kept = build()
+    retained, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del kept
+
+    print(f"{name:16} retained {retained / 2**20:6.2f} MiB ({retained / count:4.0f} B per worker)  peak {peak / 2**20:6.2f} MiB")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    models = load_models()
+    answer = get_answer(count)
+    records = [ models.WorkerRecord.from_dict(worker) for worker in json.loads(answer) ]
+
+    print(f"{count} workers, tracemalloc")
+
+    measure("dicts", lambda: json.loads(answer), count)
+    measure("WorkerRecord", lambda: [ models.WorkerRecord.from_dict(worker) for worker in json.loads(answer) ], count)
+    measure("WorkerTable", lambda: models.WorkerTable(records), count)
+
+
+if __name__ == '__main__':
+    main()